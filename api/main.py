@@ -13,25 +13,32 @@ Error mapping:
 """
 
 import asyncio
+import csv
+import io
 import logging
 import os
 import subprocess
+import tempfile
 import threading
+from datetime import datetime
 from pathlib import Path
 from threading import RLock
-from typing import Literal, Optional
+from typing import AsyncIterator, Iterator, Literal, Optional
 
+import orjson
 from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
+from starlette.background import BackgroundTask
 
-from data_store import DataRecorder, DataStore
+from data_store import SCHEMA, DataRecorder, DataStore
+from data_store.schemas import to_utc
 from data_store.store import ChunkedDataStore
 from q_sensor_lib import SensorController
 from q_sensor_lib.errors import InvalidConfigValue, MenuTimeout, SerialIOError
-from q_sensor_lib.models import ConnectionState
+from q_sensor_lib.models import ConnectionState, Reading
 
 # =============================================================================
 # Environment Configuration
@@ -43,6 +50,8 @@ API_PORT = int(os.getenv("API_PORT", "9150"))
 DEFAULT_SERIAL_PORT = os.getenv("SERIAL_PORT", "/dev/ttyUSB0")
 DEFAULT_SERIAL_BAUD = int(os.getenv("SERIAL_BAUD", "9600"))
 CHUNK_RECORDING_PATH = os.getenv("CHUNK_RECORDING_PATH", "/data/qsensor_recordings")
+EXPORT_PATH = os.getenv("EXPORT_PATH", ".")
+WS_QUEUE_SIZE = int(os.getenv("WS_QUEUE_SIZE", "64"))
 CORS_ORIGINS = os.getenv(
     "CORS_ORIGINS",
     "http://localhost:3000,http://127.0.0.1:3000,http://blueos.local,http://blueos.local:80,http://blueos.local:3000,http://blueos.local:9150"
@@ -74,6 +83,10 @@ _chunked_store: Optional[ChunkedDataStore] = None  # For live mirroring
 _chunked_recorder: Optional[DataRecorder] = None  # For chunked recording
 _lock = RLock()  # Protects state-changing operations
 
+# WebSocket subscriber queues, each mapped to the event loop that owns it.
+# Fed from the recorder thread via call_soon_threadsafe.
+_ws_subscribers: dict[asyncio.Queue, asyncio.AbstractEventLoop] = {}
+
 # =============================================================================
 # FastAPI App
 # =============================================================================
@@ -151,6 +164,18 @@ class StatsResponse(BaseModel):
     est_sample_rate_hz: Optional[float]
 
 
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Hot polling endpoints return this directly: FastAPI skips response_model
+    validation and jsonable_encoder for Response instances, while the model
+    still documents the payload in OpenAPI.
+    """
+
+    def render(self, content: dict) -> bytes:
+        return orjson.dumps(content)
+
+
 # =============================================================================
 # Chunked Recording Models (for live mirroring)
 # =============================================================================
@@ -270,17 +295,16 @@ async def get_status():
             mode = config.mode
 
     if _store:
-        df = _store.get_dataframe()
-        rows = len(df)
+        rows = _store.row_count()
 
-    return StatusResponse(
-        connected=connected,
-        recording=recording,
-        sensor_id=sensor_id,
-        mode=mode,
-        rows=rows,
-        state=state_str
-    )
+    return FastJSONResponse({
+        "connected": connected,
+        "recording": recording,
+        "sensor_id": sensor_id,
+        "mode": mode,
+        "rows": rows,
+        "state": state_str,
+    })
 
 
 @app.get("/latest")
@@ -320,7 +344,8 @@ async def get_recent(seconds: int = Query(60, ge=1, le=300)):
     seconds = min(seconds, 300)
 
     recent_df = _store.get_recent(seconds=seconds)
-    rows = recent_df.to_dict(orient="records")
+    # Missing optional fields are NaN in the frame; JSON needs null
+    rows = recent_df.astype(object).where(recent_df.notna(), None).to_dict(orient="records")
 
     return {"rows": rows}
 
@@ -360,7 +385,7 @@ async def connect(
 
         logger.info(f"Connecting to {port} at {baud} baud...")
         _controller = SensorController()
-        _store = DataStore(max_rows=100000)  # 100k rows default
+        _store = DataStore(max_rows=100000, export_dir=EXPORT_PATH)  # 100k rows default
 
         _controller.connect(port=port, baud=baud)
 
@@ -375,7 +400,8 @@ async def connect(
 async def set_config(config: Optional[ConfigRequest] = None):
     """Apply configuration changes.
 
-    Only provided fields are updated. Sensor must be in CONFIG_MENU state.
+    Only provided fields that differ from the current configuration are sent
+    to the sensor. Sensor must be in CONFIG_MENU state.
 
     Args:
         config: Optional body with averaging, adc_rate_hz, mode, tag
@@ -397,18 +423,14 @@ async def set_config(config: Optional[ConfigRequest] = None):
         updated_config = None
 
         if config:
-            # Apply each provided field
-            if config.averaging is not None:
-                logger.info(f"Setting averaging to {config.averaging}")
-                updated_config = _controller.set_averaging(config.averaging)
-
-            if config.adc_rate_hz is not None:
-                logger.info(f"Setting ADC rate to {config.adc_rate_hz} Hz")
-                updated_config = _controller.set_adc_rate(config.adc_rate_hz)
-
-            if config.mode is not None:
-                logger.info(f"Setting mode to {config.mode}")
-                updated_config = _controller.set_mode(config.mode, tag=config.tag)
+            # The controller skips fields that match its cached config; every
+            # field it does send is a full menu round trip over serial
+            updated_config = _controller.set_config(
+                averaging=config.averaging,
+                adc_rate_hz=config.adc_rate_hz,
+                mode=config.mode,
+                tag=config.tag,
+            )
 
         # Return current config
         if not updated_config:
@@ -467,11 +489,17 @@ async def start_acquisition(
         if auto_record:
             if not _store:
                 logger.info("[SENSOR/START] Creating DataStore: max_rows=100000")
-                _store = DataStore(max_rows=100000, auto_flush_interval_s=None)
+                _store = DataStore(
+                    max_rows=100000,
+                    auto_flush_interval_s=None,
+                    export_dir=EXPORT_PATH,
+                )
 
             if _recorder is None or not _recorder.is_running():
                 logger.info("[SENSOR/START] Auto-starting DataRecorder: poll_interval=0.2s")
-                _recorder = DataRecorder(_controller, _store, poll_interval_s=0.2)
+                _recorder = DataRecorder(
+                    _controller, _store, poll_interval_s=0.2, on_readings=_publish_readings
+                )
                 _recorder.start()
                 recording = True
 
@@ -510,7 +538,8 @@ async def start_recording(
         # Create store if not exists (shouldn't happen if connected properly)
         _store = DataStore(
             max_rows=max_rows,
-            auto_flush_interval_s=auto_flush_interval_s
+            auto_flush_interval_s=auto_flush_interval_s,
+            export_dir=EXPORT_PATH,
         )
 
     with _lock:
@@ -524,7 +553,9 @@ async def start_recording(
             )
 
         logger.info(f"Starting recorder (poll_interval={poll_interval_s}s)...")
-        _recorder = DataRecorder(_controller, _store, poll_interval_s=poll_interval_s)
+        _recorder = DataRecorder(
+            _controller, _store, poll_interval_s=poll_interval_s, on_readings=_publish_readings
+        )
         _recorder.start()
 
         return {"status": "recording"}
@@ -532,18 +563,22 @@ async def start_recording(
 
 @app.post("/recording/stop", response_model=RecordingStopResponse)
 async def stop_recording(
-    flush: Literal["csv", "parquet", "none"] = Query("none", description="Export format")
+    flush: Literal["csv", "parquet", "none"] = Query("none", description="Export format"),
+    output_dir: Optional[str] = Query(
+        None, description="Directory for the flushed file (default: EXPORT_PATH)"
+    ),
 ):
     """Stop DataRecorder and optionally flush to disk.
 
     Args:
         flush: Export format ("csv", "parquet", or "none")
+        output_dir: Existing directory to write the flushed file to
 
     Returns:
         {"status": "stopped", "flush_path": "..." or null}
 
     Raises:
-        400: If recorder not running
+        400: If recorder not running or output_dir is not a directory
     """
     global _recorder, _lock
 
@@ -551,10 +586,15 @@ async def stop_recording(
         if not _recorder or not _recorder.is_running():
             raise HTTPException(status_code=400, detail="Recorder not running")
 
+        if output_dir is not None and not Path(output_dir).is_dir():
+            raise HTTPException(
+                status_code=400, detail=f"output_dir is not a directory: {output_dir}"
+            )
+
         flush_path = None
         if flush != "none":
             logger.info(f"Stopping recorder with flush format: {flush}")
-            flush_path = _recorder.stop(flush_format=flush)
+            flush_path = _recorder.stop(flush_format=flush, flush_path=output_dir)
         else:
             logger.info("Stopping recorder without flush")
             _recorder.stop()
@@ -718,33 +758,50 @@ async def get_stats():
     global _store
 
     if not _store:
-        return StatsResponse(
-            row_count=0,
-            start_time=None,
-            end_time=None,
-            duration_s=None,
-            est_sample_rate_hz=None
-        )
+        return FastJSONResponse({
+            "row_count": 0,
+            "start_time": None,
+            "end_time": None,
+            "duration_s": None,
+            "est_sample_rate_hz": None,
+        })
 
-    stats = _store.get_stats()
+    # get_stats() already returns exactly the StatsResponse fields
+    return FastJSONResponse(_store.get_stats())
 
-    return StatsResponse(
-        row_count=stats["row_count"],
-        start_time=stats["start_time"],
-        end_time=stats["end_time"],
-        duration_s=stats["duration_s"],
-        est_sample_rate_hz=stats["est_sample_rate_hz"]
-    )
+
+async def _iter_csv(batches: Iterator[list[tuple]]) -> AsyncIterator[str]:
+    """Encode row batches as CSV text, one chunk per batch.
+
+    An async generator, so StreamingResponse iterates it on the event loop
+    instead of handing each chunk to the threadpool.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+
+    writer.writerow(SCHEMA.keys())
+    for batch in batches:
+        # Missing optional fields are NaN/None; write them as empty cells
+        writer.writerows(
+            ["" if v is None or v != v else v for v in row] for row in batch
+        )
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate(0)
+
+    if buf.tell():
+        yield buf.getvalue()
 
 
 @app.get("/export/csv")
 async def export_csv():
-    """Export current data to CSV file without stopping recorder.
+    """Stream current data as a CSV download without stopping recorder.
 
-    Creates a timestamped CSV file in the current directory.
+    Rows are encoded and sent in batches, so the full CSV is never held in
+    memory and nothing is written to disk.
 
     Returns:
-        FileResponse with CSV download
+        StreamingResponse with CSV download
 
     Raises:
         400: If no data available
@@ -754,29 +811,25 @@ async def export_csv():
     if not _store:
         raise HTTPException(status_code=400, detail="No data store available")
 
-    df = _store.get_dataframe()
-    if len(df) == 0:
+    if _store.row_count() == 0:
         raise HTTPException(status_code=400, detail="No data to export")
 
-    # Export to CSV
-    logger.info("Exporting data to CSV...")
-    csv_path = _store.export_csv()
-
-    if not csv_path or not Path(csv_path).exists():
-        raise HTTPException(status_code=500, detail="Failed to export CSV")
+    logger.info("Streaming data as CSV...")
+    filename = f"qsensor_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
-    return FileResponse(
-        path=csv_path,
-        media_type="text/csv",
-        filename=Path(csv_path).name
+    return StreamingResponse(
+        _iter_csv(_store.iter_rows(chunk=200)),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
 @app.get("/export/parquet")
 async def export_parquet():
-    """Export current data to Parquet file without stopping recorder.
+    """Export current data as a Parquet download without stopping recorder.
 
-    Creates a timestamped Parquet file in the current directory.
+    The file is written batch by batch to a temporary file, sent with
+    FileResponse, and deleted once the response has been sent.
 
     Returns:
         FileResponse with Parquet download
@@ -789,21 +842,25 @@ async def export_parquet():
     if not _store:
         raise HTTPException(status_code=400, detail="No data store available")
 
-    df = _store.get_dataframe()
-    if len(df) == 0:
+    if _store.row_count() == 0:
         raise HTTPException(status_code=400, detail="No data to export")
 
     # Export to Parquet
     logger.info("Exporting data to Parquet...")
-    parquet_path = _store.export_parquet()
-
-    if not parquet_path or not Path(parquet_path).exists():
-        raise HTTPException(status_code=500, detail="Failed to export Parquet")
+    with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
+        tmp_path = tmp.name
+    try:
+        parquet_path = _store.export_parquet(tmp_path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
 
+    filename = f"qsensor_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
     return FileResponse(
         path=parquet_path,
         media_type="application/octet-stream",
-        filename=Path(parquet_path).name
+        filename=filename,
+        background=BackgroundTask(os.unlink, parquet_path),
     )
 
 
@@ -832,11 +889,55 @@ app.add_api_route("/recording/export/parquet", export_parquet, methods=["GET"])
 # WebSocket Streaming
 # =============================================================================
 
+def _dumps(obj: dict) -> str:
+    """Encode a message as JSON text with orjson."""
+    return orjson.dumps(obj).decode()
+
+
+def _offer(queue: asyncio.Queue, message: str) -> None:
+    """Put a message on a subscriber queue, dropping the oldest one if it is full."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message)
+
+
+def _publish_readings(readings: list[Reading]) -> None:
+    """Fan new readings out to every WebSocket subscriber.
+
+    Called from the recorder thread. Each reading is JSON-encoded once and the
+    same text is handed to all subscriber queues on their own event loops.
+
+    Args:
+        readings: New readings just appended to the store
+    """
+    if not _ws_subscribers:
+        return
+
+    for r in readings:
+        data = r.data
+        message = _dumps({
+            "timestamp": to_utc(r.ts).isoformat(),
+            "sensor_id": r.sensor_id,
+            "mode": r.mode,
+            "value": data["value"],
+            "TempC": data.get("TempC"),
+            "Vin": data.get("Vin"),
+        })
+        for queue, loop in list(_ws_subscribers.items()):
+            try:
+                loop.call_soon_threadsafe(_offer, queue, message)
+            except RuntimeError:
+                # Subscriber's loop already closed; its handler is gone
+                _ws_subscribers.pop(queue, None)
+
+
 @app.websocket("/stream")
 async def websocket_stream(websocket: WebSocket):
     """WebSocket endpoint for real-time streaming of latest readings.
 
-    Sends JSON updates every 100-250ms (10-15 Hz) with latest reading.
+    Sends the latest stored reading on connect, then each new reading as the
+    recorder ingests it (10-15 Hz typical in freerun). A slow client only ever
+    has its oldest queued messages dropped; it never holds up the recorder.
     Client receives messages with schema keys: timestamp, sensor_id, mode, value, TempC, Vin.
 
     Usage:
@@ -856,22 +957,15 @@ async def websocket_stream(websocket: WebSocket):
         await websocket.close()
         return
 
+    queue: asyncio.Queue = asyncio.Queue(maxsize=WS_QUEUE_SIZE)
+    _ws_subscribers[queue] = asyncio.get_running_loop()
     try:
-        last_ts = None
+        latest = _store.get_latest()
+        if latest:
+            await websocket.send_text(_dumps(latest))
 
         while True:
-            # Get latest reading
-            latest = _store.get_latest()
-
-            if latest:
-                # Only send if timestamp changed (new reading)
-                current_ts = latest.get("timestamp")
-                if current_ts != last_ts:
-                    await websocket.send_json(latest)
-                    last_ts = current_ts
-
-            # Wait 100ms before next check (10 Hz)
-            await asyncio.sleep(0.1)
+            await websocket.send_text(await queue.get())
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket client disconnected: {websocket.client}")
@@ -881,6 +975,8 @@ async def websocket_stream(websocket: WebSocket):
             await websocket.close()
         except Exception:
             pass
+    finally:
+        _ws_subscribers.pop(queue, None)
 
 
 # WebSocket alias for /sensor/stream
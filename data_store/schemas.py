@@ -21,6 +21,25 @@ SCHEMA = {
 }
 
 
+def to_utc(ts: datetime) -> datetime:
+    """Normalize a timestamp to UTC.
+
+    Args:
+        ts: Timestamp; naive values are assumed to already be UTC
+            (controller uses datetime.now(timezone.utc))
+
+    Returns:
+        Timezone-aware UTC datetime
+    """
+    tzinfo = ts.tzinfo
+    if tzinfo is timezone.utc:
+        return ts
+    if tzinfo is None:
+        return ts.replace(tzinfo=timezone.utc)
+    # Convert to UTC if in different timezone
+    return ts.astimezone(timezone.utc)
+
+
 def reading_to_row(reading: Reading) -> Dict[str, any]:
     """Convert a Reading instance to a DataFrame row dictionary.
 
@@ -39,14 +58,7 @@ def reading_to_row(reading: Reading) -> Dict[str, any]:
     if "value" not in reading.data:
         raise ValueError(f"Reading missing required 'value' field: {reading}")
 
-    # Convert naive datetime to UTC if needed
-    ts = reading.ts
-    if ts.tzinfo is None:
-        # Assume naive timestamps are UTC (controller uses datetime.now(timezone.utc))
-        ts = ts.replace(tzinfo=timezone.utc)
-    elif ts.tzinfo != timezone.utc:
-        # Convert to UTC if in different timezone
-        ts = ts.astimezone(timezone.utc)
+    ts = to_utc(reading.ts)
 
     # Build row with all schema keys
     row = {
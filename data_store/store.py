@@ -1,7 +1,7 @@
-"""Thread-safe DataFrame store and background recorder for Q-Sensor data.
+"""Thread-safe columnar store and background recorder for Q-Sensor data.
 
 This module provides:
-- DataStore: Thread-safe in-memory DataFrame with export capabilities
+- DataStore: Thread-safe in-memory column store with DataFrame views and export capabilities
 - DataRecorder: Background thread that polls SensorController buffer and records to DataStore
 
 Design notes:
@@ -11,27 +11,107 @@ Design notes:
 - Recorder must stop and flush BEFORE controller stops to avoid losing buffered data
 """
 
+import functools
 import logging
 import threading
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from threading import Event, RLock, Thread
-from typing import Iterable, Optional
+from threading import Condition, Event, RLock, Thread
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional
 
+import numpy as np
 import pandas as pd
 
 from data_store.schemas import SCHEMA, reading_to_row
 from q_sensor_lib.controller import SensorController
 from q_sensor_lib.models import Reading
 
+if TYPE_CHECKING:
+    import csv
+
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 
-class DataStore:
-    """Thread-safe in-memory DataFrame store for sensor readings.
+# SCHEMA column names in order, resolved once at import
+_SCHEMA_COLUMNS: tuple[str, ...] = tuple(SCHEMA)
+
+# In-memory column dtypes. Low-cardinality string columns hold int16 codes
+# into per-store label arrays and surface as pandas Categoricals; missing
+# optional fields are NaN. Timestamps are UTC, as in q_sensor_lib.ring_buffer.
+_CATEGORICAL_COLUMNS: tuple[str, ...] = ("sensor_id", "mode")
+_COLUMN_DTYPES: dict[str, np.dtype] = {
+    name: np.dtype(dtype)
+    for name, dtype in {
+        "timestamp": "datetime64[us]",
+        "sensor_id": "i2",
+        "mode": "i2",
+        "value": "f8",
+        "TempC": "f8",
+        "Vin": "f8",
+    }.items()
+}
+_INITIAL_CAPACITY = 1024
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)  # Naive timestamps are UTC (see schemas.to_utc)
+_ONE_US = timedelta(microseconds=1)
+
+
+def _iso_timestamps(timestamps: np.ndarray) -> list[str]:
+    """Format UTC datetime64[us] values exactly as datetime.isoformat() would."""
+    return [
+        text[:-7] + "+00:00" if text.endswith(".000000") else text + "+00:00"
+        for text in np.datetime_as_string(timestamps, unit="us").tolist()
+    ]
+
+
+def _iter_row_batches(cols: dict[str, np.ndarray], chunk: int) -> Iterator[list[tuple]]:
+    """Yield rows of column arrays in batches of tuples, in SCHEMA column order."""
+    row_count = len(cols["timestamp"])
+
+    for start in range(0, row_count, chunk):
+        window = [
+            _iso_timestamps(cols[name][start : start + chunk])
+            if name == "timestamp"
+            else cols[name][start : start + chunk].tolist()
+            for name in _SCHEMA_COLUMNS
+        ]
+        yield list(zip(*window))
+
+
+def _to_frame(cols: dict[str, np.ndarray], copy: bool = True) -> pd.DataFrame:
+    """Build a DataFrame from column arrays, formatting timestamps as ISO 8601.
+
+    With copy=False each column stays a view of its array (one block per
+    column, no consolidation memcpy); only use that for frames that are
+    never handed to callers unprotected.
+    """
+    data = dict(cols)
+    data["timestamp"] = _iso_timestamps(cols["timestamp"])
+    return pd.DataFrame(data, columns=_SCHEMA_COLUMNS, copy=copy)
+
+
+@functools.lru_cache(maxsize=1)
+def _arrow_schema() -> "pa.Schema":
+    """Arrow schema matching SCHEMA, for Parquet export (built once)."""
+    import pyarrow as pa
+
+    types = {str: pa.string(), float: pa.float64()}
+    return pa.schema([(name, types[dtype]) for name, dtype in SCHEMA.items()])
 
-    Maintains a pandas DataFrame with normalized schema (timestamp, sensor_id, mode, value, TempC, Vin).
+
+class DataStore:
+    """Thread-safe in-memory columnar store for sensor readings.
+
+    Keeps one preallocated numpy array per schema column (timestamp, sensor_id,
+    mode, value, TempC, Vin) and builds pandas DataFrames on demand. sensor_id
+    and mode are stored as int16 codes and returned as categoricals. Capacity
+    doubles when the arrays fill up, so appends are amortized O(1) with few
+    reallocations. Timestamps are held as UTC datetime64[us] and only formatted
+    as ISO 8601 when a frame or export is produced.
     Supports concurrent appends, queries, statistics, and export to CSV/Parquet.
 
     Optional auto-flush: If auto_flush_interval_s is set, a background thread periodically
@@ -44,23 +124,48 @@ class DataStore:
         auto_flush_interval_s: Optional[float] = None,
         auto_flush_format: str = "csv",
         auto_flush_path: Optional[str] = None,
+        export_dir: Optional[str] = None,
     ) -> None:
-        """Initialize empty DataFrame store.
+        """Initialize empty store.
 
         Args:
             max_rows: Maximum rows to keep in memory. Older rows are trimmed after appends.
             auto_flush_interval_s: If set, enable background auto-flush every N seconds.
             auto_flush_format: Format for auto-flush ("csv" or "parquet").
             auto_flush_path: Path for auto-flush output. If None, auto-generates timestamped name.
+            export_dir: Directory for auto-generated export filenames. If None, uses the
+                current working directory.
         """
         self._lock = RLock()
-        self._df = pd.DataFrame(columns=list(SCHEMA.keys()))
+        self._rows_added = Condition(self._lock)  # Notified after every append
         self._max_rows = max_rows
 
+        # Live rows are _cols[name][_start:_end]. Slots below _end are never
+        # rewritten: compaction and clear() swap in new arrays, so views
+        # handed out by _snapshot() stay valid without copying.
+        self._cols = self._allocate(min(_INITIAL_CAPACITY, max_rows))
+        self._start = 0
+        self._end = 0
+        # Categorical columns: label -> code, and code -> label. The label
+        # arrays are replaced, never extended in place, so snapshots can hold them.
+        self._codes: dict[str, dict[str, int]] = {}
+        self._labels: dict[str, np.ndarray] = {}
+        self._reset_labels()
+        # Whether live timestamps are non-decreasing, so get_recent() can
+        # binary-search the cutoff. The recorder appends in arrival order;
+        # one out-of-order append falls back to a full scan until clear().
+        self._ts_sorted = True
+
+        # Last materialized DataFrame, keyed by _version (bumped on every
+        # append/clear; row count alone stops changing once trimming starts)
+        self._version = 0
+        self._frame_cache: Optional[tuple[int, pd.DataFrame]] = None
+
         # Auto-flush configuration
         self._auto_flush_interval = auto_flush_interval_s
         self._auto_flush_format = auto_flush_format
         self._auto_flush_path = auto_flush_path
+        self._export_dir = export_dir
         self._flush_thread: Optional[Thread] = None
         self._flush_stop_event = Event()
 
@@ -69,44 +174,194 @@ class DataStore:
             self._start_auto_flush()
 
     def append_readings(self, readings: Iterable[Reading]) -> None:
-        """Append multiple readings to DataFrame.
+        """Append multiple readings to the store.
 
-        Thread-safe. Converts readings to rows, appends to DataFrame, and trims to max_rows.
+        Thread-safe. Flattens each reading with Reading.to_tuple(), transposes the
+        rows into per-column arrays, copies them in after the live rows, and trims
+        to max_rows.
 
         Args:
             readings: Iterable of Reading instances (e.g., from controller.read_buffer_snapshot())
+
+        Raises:
+            ValueError: If a reading's data is missing the required "value" key
         """
-        if not readings:
+        rows = [r.to_tuple() for r in readings]
+        if not rows:
             return
+        # Transpose rows to columns in one C-level pass
+        ts_col, sid_col, mode_col, value_col, temp_col, vin_col = zip(*rows)
+
+        # Only the newest max_rows of an oversized batch can survive the trim
+        keep_from = max(len(ts_col) - self._max_rows, 0)
+        self._append_columns(
+            {
+                "timestamp": np.array(
+                    # Epoch offset straight from the datetime: subtracting aware
+                    # values already accounts for any UTC offset, so no to_utc()
+                    [
+                        (ts - (_EPOCH_NAIVE if ts.tzinfo is None else _EPOCH)) // _ONE_US
+                        for ts in ts_col[keep_from:]
+                    ],
+                    dtype="i8",
+                ).view("datetime64[us]"),
+                "sensor_id": sid_col[keep_from:],
+                "mode": mode_col[keep_from:],
+                "value": np.array(value_col[keep_from:], dtype="f8"),
+                "TempC": np.array(temp_col[keep_from:], dtype="f8"),
+                "Vin": np.array(vin_col[keep_from:], dtype="f8"),
+            }
+        )
 
-        rows = [reading_to_row(r) for r in readings]
+    def append_arrays(
+        self,
+        timestamps: np.ndarray,
+        value: np.ndarray,
+        sensor_id: str,
+        mode: str,
+        temp_c: Optional[np.ndarray] = None,
+        vin: Optional[np.ndarray] = None,
+    ) -> None:
+        """Append a batch of readings from one sensor given as column arrays.
+
+        Thread-safe. Bulk-ingest counterpart of append_readings() that skips
+        Reading objects entirely: each column is copied into the store with one
+        slice assignment, then trimmed to max_rows.
+
+        Args:
+            timestamps: datetime64 values (any unit; naive values are UTC)
+            value: Reading values, same length as timestamps
+            sensor_id: Sensor ID shared by every row
+            mode: "freerun" or "polled", shared by every row
+            temp_c: Optional temperatures (NaN where absent); all NaN if None
+            vin: Optional input voltages (NaN where absent); all NaN if None
+
+        Raises:
+            ValueError: If the arrays differ in length
+        """
+        ts = np.asarray(timestamps, dtype="datetime64[us]")
+        columns = {"value": value, "TempC": temp_c, "Vin": vin}
+        arrays = {
+            name: np.asarray(col, dtype="f8") for name, col in columns.items() if col is not None
+        }
+        for name, arr in arrays.items():
+            if arr.shape != ts.shape:
+                raise ValueError(
+                    f"{name} has {len(arr)} rows, expected {len(ts)} to match timestamps"
+                )
+
+        keep_from = max(len(ts) - self._max_rows, 0)
+        self._append_columns(
+            {
+                "timestamp": ts[keep_from:],
+                "sensor_id": sensor_id,  # Scalars broadcast over the batch
+                "mode": mode,
+                "value": arrays["value"][keep_from:],
+                "TempC": arrays["TempC"][keep_from:] if "TempC" in arrays else np.nan,
+                "Vin": arrays["Vin"][keep_from:] if "Vin" in arrays else np.nan,
+            }
+        )
+
+    def _append_columns(self, batch: dict) -> None:
+        """Copy a batch of at most max_rows rows in after the live rows and trim.
+
+        Args:
+            batch: Column name -> values for the batch. "timestamp" must be a
+                datetime64[us] array; other columns may be scalars to broadcast.
+        """
+        batch_ts = batch["timestamp"]
+        n = len(batch_ts)
+        if not n:
+            return
+        batch_sorted = n < 2 or bool((batch_ts[1:] >= batch_ts[:-1]).all())
+        # Distinct labels per categorical column; usually a single one per batch
+        distinct = {
+            name: {batch[name]} if isinstance(batch[name], str) else set(batch[name])
+            for name in _CATEGORICAL_COLUMNS
+        }
 
         with self._lock:
-            # Append new rows
-            new_df = pd.DataFrame(rows, columns=list(SCHEMA.keys()))
-            self._df = pd.concat([self._df, new_df], ignore_index=True)
+            batch = dict(batch)
+            for name in _CATEGORICAL_COLUMNS:
+                batch[name] = self._encode(name, batch[name], distinct[name])
+            if self._ts_sorted:
+                last = self._cols["timestamp"][self._end - 1] if self._end > self._start else None
+                if not batch_sorted or (last is not None and batch_ts[0] < last):
+                    self._ts_sorted = False
+            self._reserve(n)
+            end = self._end
+            for name, col in self._cols.items():
+                col[end : end + n] = batch[name]
+            self._end = end + n
+            self._version += 1
 
             # Trim to max_rows (keep most recent)
-            if len(self._df) > self._max_rows:
-                excess = len(self._df) - self._max_rows
-                self._df = self._df.iloc[excess:].reset_index(drop=True)
-                logger.debug(f"Trimmed {excess} oldest rows, now {len(self._df)} rows")
+            excess = self._end - self._start - self._max_rows
+            if excess > 0:
+                self._start += excess
+                logger.debug(f"Trimmed {excess} oldest rows, now {self._max_rows} rows")
+
+            self._rows_added.notify_all()
 
     def get_dataframe(self) -> pd.DataFrame:
-        """Get copy of entire DataFrame.
+        """Get the stored readings as a new DataFrame.
 
-        Thread-safe. Returns a defensive copy to prevent external modification.
+        Thread-safe. Returns a copy of the cached frame, so it can be modified freely.
 
         Returns:
-            Copy of internal DataFrame
+            DataFrame with SCHEMA columns
+        """
+        return self._frame().copy()
+
+    def row_count(self) -> int:
+        """Get the number of stored readings without building a DataFrame.
+
+        Thread-safe.
+
+        Returns:
+            Number of rows currently held
         """
         with self._lock:
-            return self._df.copy()
+            return self._end - self._start
+
+    def wait_for_rows(self, n: int, timeout: Optional[float] = 5.0) -> bool:
+        """Block until the store holds at least n rows.
+
+        Thread-safe. Woken by appends rather than polling.
+
+        Args:
+            n: Row count to wait for
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if n rows are present, False if the timeout expired first
+        """
+        with self._rows_added:
+            return self._rows_added.wait_for(
+                lambda: self._end - self._start >= n, timeout
+            )
+
+    def iter_rows(self, chunk: int = 200) -> Iterator[list[tuple]]:
+        """Yield stored rows in batches of plain tuples, in SCHEMA column order.
+
+        Thread-safe. The snapshot is taken at the call, not on the first next(),
+        so appends or a clear() between the call and iteration are not seen.
+
+        Args:
+            chunk: Maximum number of rows per batch
+
+        Returns:
+            Iterator over lists of up to chunk row tuples, with timestamps as
+            ISO 8601 strings and missing optional fields as NaN
+        """
+        return _iter_row_batches(self._snapshot(), chunk)
 
     def get_recent(self, seconds: int = 60) -> pd.DataFrame:
         """Get readings from the last N seconds.
 
-        Thread-safe. Filters by timestamp column (ISO 8601 strings converted to datetime).
+        Thread-safe. While timestamps have arrived in order, the cutoff is found
+        by binary search and the window is a slice; otherwise the stored
+        timestamps are compared in one vectorized pass. No timestamp parsing.
 
         Args:
             seconds: Number of seconds of recent history to retrieve
@@ -114,22 +369,49 @@ class DataStore:
         Returns:
             DataFrame containing only readings within the time window
         """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=seconds)
+        cutoff_us = np.datetime64((cutoff - _EPOCH) // _ONE_US, "us")
+
         with self._lock:
-            if self._df.empty:
-                return pd.DataFrame(columns=list(SCHEMA.keys()))
+            cols = self._snapshot()
+            ts_sorted = self._ts_sorted
 
-            # Convert timestamp strings to datetime for filtering
-            df = self._df.copy()
-            df["timestamp"] = pd.to_datetime(df["timestamp"], format="ISO8601", utc=True)
+        if ts_sorted:
+            first = int(np.searchsorted(cols["timestamp"], cutoff_us, side="left"))
+            return _to_frame({name: col[first:] for name, col in cols.items()})
+        keep = cols["timestamp"] >= cutoff_us
+        return _to_frame({name: col[keep] for name, col in cols.items()})
 
-            # Filter to recent window
-            cutoff = datetime.now(timezone.utc) - timedelta(seconds=seconds)
-            recent = df[df["timestamp"] >= cutoff].copy()  # Explicit copy to avoid SettingWithCopyWarning
+    def _encode(self, name: str, values: object, distinct: set) -> object:
+        """Map a column's labels to codes, registering new ones. Caller holds the lock.
 
-            # Convert timestamps back to ISO strings to match schema
-            recent["timestamp"] = recent["timestamp"].apply(lambda x: x.isoformat())
+        Args:
+            name: Categorical column name
+            values: One label for the whole batch, or a sequence of labels
+            distinct: The distinct labels in values
 
-            return recent.reset_index(drop=True)
+        Returns:
+            A scalar code when the batch has one label (broadcast on copy),
+            otherwise an int16 code array
+        """
+        codes = self._codes[name]
+        new = [label for label in distinct if label not in codes]
+        if new:
+            for label in new:
+                codes[label] = len(codes)
+            labels = np.empty(len(codes), dtype=object)
+            labels[: len(self._labels[name])] = self._labels[name]
+            labels[len(self._labels[name]) :] = new
+            self._labels[name] = labels
+
+        if len(distinct) == 1:
+            return codes[next(iter(distinct))]
+        return np.array([codes[label] for label in values], dtype=_COLUMN_DTYPES[name])
+
+    def _reset_labels(self) -> None:
+        """Forget all categorical labels. Caller holds the lock (or is __init__)."""
+        self._codes = {name: {} for name in _CATEGORICAL_COLUMNS}
+        self._labels = {name: np.empty(0, dtype=object) for name in _CATEGORICAL_COLUMNS}
 
     def get_latest(self) -> Optional[dict]:
         """Get the most recent reading as a dictionary.
@@ -137,17 +419,30 @@ class DataStore:
         Thread-safe.
 
         Returns:
-            Dictionary of latest row, or None if DataFrame is empty
+            Dictionary of latest row (missing optional fields as None), or None if
+            store is empty
         """
         with self._lock:
-            if self._df.empty:
+            if self._end == self._start:
                 return None
-            return self._df.iloc[-1].to_dict()
+            i = self._end - 1
+            latest = {name: col[i : i + 1] for name, col in self._cols.items()}
+            labels = self._labels
+
+        row = {"timestamp": _iso_timestamps(latest.pop("timestamp"))[0]}
+        for name, col in latest.items():
+            value = col.tolist()[0]
+            row[name] = labels[name][value] if name in labels else value
+        for name in ("TempC", "Vin"):
+            if row[name] != row[name]:  # NaN: field was absent
+                row[name] = None
+        return row
 
     def get_stats(self) -> dict:
         """Get summary statistics about stored data.
 
-        Thread-safe.
+        Thread-safe and O(1): the count and time range come from the live row
+        bounds and their first/last timestamps, which appends and trims keep current.
 
         Returns:
             Dictionary with keys:
@@ -158,7 +453,8 @@ class DataStore:
                 - est_sample_rate_hz: Estimated sample rate (or 0)
         """
         with self._lock:
-            if self._df.empty:
+            row_count = self._end - self._start
+            if not row_count:
                 return {
                     "row_count": 0,
                     "start_time": None,
@@ -166,68 +462,185 @@ class DataStore:
                     "duration_s": 0.0,
                     "est_sample_rate_hz": 0.0,
                 }
+            timestamps = self._cols["timestamp"]
+            bounds = timestamps[[self._start, self._end - 1]]
+
+        duration_s = float((bounds[1] - bounds[0]) / np.timedelta64(1, "s"))
+        start_time, end_time = _iso_timestamps(bounds)
+
+        # Estimate sample rate
+        rate_hz = 0.0
+        if duration_s > 0 and row_count > 1:
+            rate_hz = (row_count - 1) / duration_s
+
+        return {
+            "row_count": row_count,
+            "start_time": start_time,
+            "end_time": end_time,
+            "duration_s": duration_s,
+            "est_sample_rate_hz": rate_hz,
+        }
 
-            # Parse timestamps
-            timestamps = pd.to_datetime(self._df["timestamp"], format="ISO8601", utc=True)
-            start = timestamps.iloc[0]
-            end = timestamps.iloc[-1]
-            duration_s = (end - start).total_seconds()
+    def export_csv(self, path: Optional[str] = None, chunk: int = 65536) -> str:
+        """Export stored readings to CSV file.
 
-            # Estimate sample rate
-            rate_hz = 0.0
-            if duration_s > 0 and len(self._df) > 1:
-                rate_hz = (len(self._df) - 1) / duration_s
+        Thread-safe. Auto-generates filename if path is not provided or is a directory.
+        Rows are formatted and written window by window from a snapshot of the
+        column arrays, so only one window of ISO timestamps and CSV text is held
+        at a time.
 
-            return {
-                "row_count": len(self._df),
-                "start_time": start.isoformat(),
-                "end_time": end.isoformat(),
-                "duration_s": duration_s,
-                "est_sample_rate_hz": rate_hz,
-            }
+        Args:
+            path: Output file path, or a directory to generate a timestamped filename in.
+                If None, generates timestamped filename in export_dir.
+            chunk: Maximum number of rows formatted per write
 
-    def export_csv(self, path: Optional[str] = None) -> str:
-        """Export DataFrame to CSV file.
+        Returns:
+            Absolute path to exported file
+        """
+        with self._lock:
+            path = self._export_path("csv", path)
+            cols = self._snapshot()
+        row_count = len(cols["timestamp"])
+
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            # At least one (possibly empty) window, so the header is always written
+            for start in range(0, max(row_count, 1), chunk):
+                window = {name: col[start : start + chunk] for name, col in cols.items()}
+                _to_frame(window, copy=False).to_csv(f, index=False, header=start == 0)
+
+        abs_path = str(Path(path).resolve())
+        logger.info(f"Exported {row_count} rows to CSV: {abs_path}")
+        return abs_path
 
-        Thread-safe. Auto-generates filename if path not provided.
+    def export_parquet(self, path: Optional[str] = None, chunk: int = 65536) -> str:
+        """Export stored readings to Parquet file.
+
+        Thread-safe. Auto-generates filename if path is not provided or is a directory.
+        Column arrays are handed to Arrow window by window and written with a
+        zstd-compressed ParquetWriter, so only one window is converted at a time.
+        Missing optional fields are written as nulls.
+        Requires pyarrow to be installed.
 
         Args:
-            path: Output file path. If None, generates timestamped filename.
+            path: Output file path, or a directory to generate a timestamped filename in.
+                If None, generates timestamped filename in export_dir.
+            chunk: Maximum number of rows per record batch
 
         Returns:
             Absolute path to exported file
         """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
         with self._lock:
-            if path is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                path = f"qsensor_data_{timestamp}.csv"
+            path = self._export_path("parquet", path)
+            cols = self._snapshot()
+
+        schema = _arrow_schema()
+        row_count = len(cols["timestamp"])
+        # zstd level 1 encodes about as fast as snappy here (the per-row isoformat
+        # dominates export time) and produces files 2-3x smaller
+        with pq.ParquetWriter(
+            path, schema, compression="zstd", compression_level=1
+        ) as writer:
+            for start in range(0, row_count, chunk):
+                arrays = []
+                for field in schema:
+                    window = cols[field.name][start : start + chunk]
+                    if field.name == "timestamp":
+                        window = _iso_timestamps(window)
+                    arrays.append(pa.array(window, type=field.type, from_pandas=True))
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+
+        abs_path = str(Path(path).resolve())
+        logger.info(f"Exported {row_count} rows to Parquet: {abs_path}")
+        return abs_path
+
+    @staticmethod
+    def _allocate(capacity: int) -> dict[str, np.ndarray]:
+        """Allocate empty column arrays with room for capacity rows."""
+        return {name: np.empty(capacity, dtype=dtype) for name, dtype in _COLUMN_DTYPES.items()}
+
+    def _reserve(self, n: int) -> None:
+        """Make room for n more rows after _end. Caller must hold the lock.
+
+        When the arrays are full, live rows (already trimmed to what will survive
+        the append) are copied into new arrays. Capacity doubles until at least
+        half of it is free after the copy, which keeps compaction amortized O(1).
+
+        Args:
+            n: Number of rows about to be appended (at most max_rows)
+        """
+        capacity = len(self._cols["timestamp"])
+        if self._end + n <= capacity:
+            return
 
-            self._df.to_csv(path, index=False)
-            abs_path = str(Path(path).resolve())
-            logger.info(f"Exported {len(self._df)} rows to CSV: {abs_path}")
-            return abs_path
+        keep = min(self._end - self._start, self._max_rows - n)
+        needed = keep + n
+        while capacity < 2 * needed:
+            capacity = max(capacity * 2, 1)
 
-    def export_parquet(self, path: Optional[str] = None) -> str:
-        """Export DataFrame to Parquet file.
+        old_start = self._end - keep
+        cols = self._allocate(capacity)
+        for name, col in self._cols.items():
+            cols[name][:keep] = col[old_start : self._end]
+        self._cols = cols
+        self._start = 0
+        self._end = keep
 
-        Thread-safe. Auto-generates filename if path not provided.
-        Requires pyarrow or fastparquet to be installed.
+    def _frame(self) -> pd.DataFrame:
+        """Get the live rows as a DataFrame, rebuilt only after the store changes.
+
+        The returned frame is shared with the cache and must not be modified.
+        """
+        with self._lock:
+            version = self._version
+            cached = self._frame_cache
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            cols = self._snapshot()
+
+        # Format outside the lock; appends meanwhile just make this entry stale.
+        # The cached frame views the store arrays: get_dataframe() copies it
+        df = _to_frame(cols, copy=False)
+        with self._lock:
+            if self._version == version:
+                self._frame_cache = (version, df)
+        return df
+
+    def _snapshot(self) -> dict:
+        """Get views of the live rows under the lock (no copy; see __init__).
+
+        Categorical columns come back as pd.Categorical over the code views.
+        """
+        with self._lock:
+            start, end = self._start, self._end
+            cols = {name: col[start:end] for name, col in self._cols.items()}
+            labels = self._labels
+
+        for name in _CATEGORICAL_COLUMNS:
+            cols[name] = pd.Categorical.from_codes(cols[name], categories=labels[name])
+        return cols
+
+    def _export_path(self, extension: str, path: Optional[str]) -> str:
+        """Resolve an export target, generating a timestamped filename if needed.
 
         Args:
-            path: Output file path. If None, generates timestamped filename.
+            extension: File extension for generated names ("csv" or "parquet")
+            path: Explicit file path, a directory, or None for export_dir
 
         Returns:
-            Absolute path to exported file
+            Path to write the export to
         """
-        with self._lock:
-            if path is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                path = f"qsensor_data_{timestamp}.parquet"
+        if path is not None and not Path(path).is_dir():
+            return path
 
-            self._df.to_parquet(path, index=False)
-            abs_path = str(Path(path).resolve())
-            logger.info(f"Exported {len(self._df)} rows to Parquet: {abs_path}")
-            return abs_path
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"qsensor_data_{timestamp}.{extension}"
+        directory = path if path is not None else self._export_dir
+        if directory is None:
+            return filename
+        return str(Path(directory) / filename)
 
     def flush_to_disk(self, format: str = "csv", path: Optional[str] = None) -> str:
         """Flush current DataFrame to disk.
@@ -236,7 +649,7 @@ class DataStore:
 
         Args:
             format: "csv" or "parquet"
-            path: Output file path (optional, auto-generated if None)
+            path: Output file path or directory (optional, auto-generated if None)
 
         Returns:
             Absolute path to exported file
@@ -254,10 +667,16 @@ class DataStore:
     def clear(self) -> None:
         """Clear all stored data.
 
-        Thread-safe. Resets DataFrame to empty with schema intact.
+        Thread-safe. Empties every column, keeping the schema intact.
         """
         with self._lock:
-            self._df = pd.DataFrame(columns=list(SCHEMA.keys()))
+            self._cols = self._allocate(min(_INITIAL_CAPACITY, self._max_rows))
+            self._start = 0
+            self._end = 0
+            self._reset_labels()
+            self._ts_sorted = True
+            self._version += 1
+            self._frame_cache = None
             logger.debug("DataStore cleared")
 
     def _start_auto_flush(self) -> None:
@@ -283,7 +702,7 @@ class DataStore:
         while not self._flush_stop_event.wait(timeout=self._auto_flush_interval):
             try:
                 with self._lock:
-                    if not self._df.empty:
+                    if self._end > self._start:
                         self.flush_to_disk(
                             format=self._auto_flush_format,
                             path=self._auto_flush_path,
@@ -307,7 +726,8 @@ class DataRecorder:
 
     Runs a background thread that:
     1. Every 200ms (configurable), calls controller.read_buffer_snapshot()
-    2. Filters to new readings (timestamp > last_seen_ts)
+    2. Filters to new readings (timestamp > last_seen_ts), scanning back from the
+       newest so each poll costs O(new readings), not O(buffer size)
     3. Appends new readings to DataStore
     4. Updates last_seen_ts
 
@@ -324,6 +744,7 @@ class DataRecorder:
         controller: SensorController,
         store: DataStore,
         poll_interval_s: float = 0.2,
+        on_readings: Optional[Callable[[list[Reading]], None]] = None,
     ) -> None:
         """Initialize recorder (does not start automatically).
 
@@ -331,10 +752,13 @@ class DataRecorder:
             controller: SensorController instance (must be in acquisition mode before start())
             store: DataStore instance to write readings to
             poll_interval_s: Polling interval in seconds (default 200ms)
+            on_readings: Optional callback invoked from the recorder thread with each
+                         batch of new readings, after they are appended to the store
         """
         self._controller = controller
         self._store = store
         self._poll_interval = poll_interval_s
+        self._on_readings = on_readings
 
         self._thread: Optional[Thread] = None
         self._stop_event = Event()
@@ -361,7 +785,9 @@ class DataRecorder:
         self._thread.start()
         logger.info("DataRecorder started")
 
-    def stop(self, flush_format: Optional[str] = None) -> Optional[str]:
+    def stop(
+        self, flush_format: Optional[str] = None, flush_path: Optional[str] = None
+    ) -> Optional[str]:
         """Stop recording thread and optionally flush data to disk.
 
         CRITICAL: Call this BEFORE stopping the SensorController to ensure all buffered
@@ -370,6 +796,8 @@ class DataRecorder:
         Args:
             flush_format: If "csv" or "parquet", flush DataStore to disk before stopping.
                          If None, no flush is performed.
+            flush_path: Output file path or directory for the flush. If None, a
+                        timestamped file is written to the store's export_dir.
 
         Returns:
             Path to flushed file if flush_format was specified, None otherwise
@@ -388,13 +816,13 @@ class DataRecorder:
         self._thread = None
 
         # Flush if requested
-        flush_path = None
+        flushed_to = None
         if flush_format:
             logger.info(f"Flushing data to {flush_format}...")
-            flush_path = self._store.flush_to_disk(format=flush_format)
+            flushed_to = self._store.flush_to_disk(format=flush_format, path=flush_path)
 
         logger.info("DataRecorder stopped")
-        return flush_path
+        return flushed_to
 
     def is_running(self) -> bool:
         """Check if recorder thread is active.
@@ -417,16 +845,23 @@ class DataRecorder:
                     continue  # No new data
 
                 # Filter to new readings (ts > last_seen_ts)
-                if self._last_seen_ts is None:
+                last_seen_ts = self._last_seen_ts
+                if last_seen_ts is None:
                     # First batch: take all
                     new_readings = snapshot
                 else:
-                    # Filter to readings newer than last_seen_ts
-                    new_readings = [r for r in snapshot if r.ts > self._last_seen_ts]
+                    # Snapshot is oldest to newest, so new readings form its
+                    # tail: walk back only as far as the last one recorded
+                    first_new = len(snapshot)
+                    while first_new and snapshot[first_new - 1].ts > last_seen_ts:
+                        first_new -= 1
+                    new_readings = snapshot[first_new:]
 
                 if new_readings:
                     # Append to store
                     self._store.append_readings(new_readings)
+                    if self._on_readings is not None:
+                        self._on_readings(new_readings)
 
                     # Update last_seen_ts to newest reading
                     self._last_seen_ts = max(r.ts for r in new_readings)
@@ -476,6 +911,7 @@ class ChunkedDataStore:
         # State
         self._chunk_index = 0
         self._current_file: Optional[object] = None  # TextIOWrapper
+        self._current_writer: Optional["csv.DictWriter"] = None  # Bound to _current_file
         self._current_path: Optional[Path] = None
         self._chunk_start_time: Optional[float] = None
         self._total_rows = 0
@@ -528,45 +964,52 @@ class ChunkedDataStore:
             return
 
         rows = [reading_to_row(r) for r in readings]
-        for row in rows:
-            self._append_row(row)
+        now = time.time()
+        # One lock acquisition and clock read per batch; roll conditions are
+        # still checked after every row so size-based rolls land on time
+        with self._lock:
+            for row in rows:
+                self._write_row(row, now)
 
     def _append_row(self, row: dict) -> None:
         """Append a single reading row.
 
+        Args:
+            row: Dictionary with schema keys (timestamp, sensor_id, mode, value, TempC, Vin)
+        """
+        with self._lock:
+            self._write_row(row, time.time())
+
+    def _write_row(self, row: dict, now: float) -> None:
+        """Write one row to the current chunk (caller holds the lock).
+
         Opens a new chunk file if needed, writes CSV row, checks roll condition.
 
         Args:
             row: Dictionary with schema keys (timestamp, sensor_id, mode, value, TempC, Vin)
+            now: Current timestamp (from time.time())
         """
-        import csv
-        import time
+        # Open new chunk if needed
+        if self._current_file is None:
+            self._open_new_chunk()
 
-        with self._lock:
-            # Open new chunk if needed
-            if self._current_file is None:
-                self._open_new_chunk()
-
-            # Write row
-            assert self._current_file is not None
-            writer = csv.DictWriter(self._current_file, fieldnames=list(SCHEMA.keys()))
-            writer.writerow(row)
-
-            # Update counters
-            self._current_chunk_rows += 1
-            self._total_rows += 1
-            # Approximate row size (CSV text length)
-            row_size = sum(len(str(v)) for v in row.values()) + len(row) + 1  # +commas +newline
-            self._current_chunk_bytes += row_size
-
-            # Check if roll is needed
-            now = time.time()
-            self.roll_if_needed(now)
+        # Write row
+        assert self._current_writer is not None
+        self._current_writer.writerow(row)
+
+        # Update counters
+        self._current_chunk_rows += 1
+        self._total_rows += 1
+        # Approximate row size (CSV text length)
+        row_size = sum(len(str(v)) for v in row.values()) + len(row) + 1  # +commas +newline
+        self._current_chunk_bytes += row_size
+
+        # Check if roll is needed
+        self.roll_if_needed(now)
 
     def _open_new_chunk(self) -> None:
         """Open a new chunk file with CSV header."""
         import csv
-        import time
 
         # Generate chunk filename (base name without extension)
         chunk_name = f"chunk_{self._chunk_index:05d}"
@@ -574,12 +1017,13 @@ class ChunkedDataStore:
 
         # Open file and write header
         self._current_file = open(self._current_path, 'w', encoding='utf-8', newline='')
-        writer = csv.DictWriter(self._current_file, fieldnames=list(SCHEMA.keys()))
+        writer = csv.DictWriter(self._current_file, fieldnames=_SCHEMA_COLUMNS)
         writer.writeheader()
+        self._current_writer = writer
 
         self._chunk_start_time = time.time()
         self._current_chunk_rows = 0
-        self._current_chunk_bytes = len(','.join(SCHEMA.keys())) + 1  # Header size
+        self._current_chunk_bytes = len(','.join(_SCHEMA_COLUMNS)) + 1  # Header size
 
         logger.debug(f"Opened new chunk: {chunk_name}.tmp")
 
@@ -624,6 +1068,7 @@ class ChunkedDataStore:
         # If another thread calls _append_row() during finalization, it will
         # see _current_file is None and open a new chunk instead of writing to closed file
         self._current_file = None
+        self._current_writer = None
         self._current_path = None
         self._chunk_start_time = None
         self._current_chunk_rows = 0
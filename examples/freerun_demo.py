@@ -4,9 +4,36 @@ Pi Runbook A: Freerun Mode Test
 Expected: ~10 readings over 10 seconds at 1 Hz
 """
 
+import queue
+import threading
 import time
 from q_sensor_lib import SensorController
 
+
+def printer(updates):
+    """Print live updates queued by the sampling loop until a None sentinel."""
+    while True:
+        item = updates.get()
+        if item is None:
+            return
+        elapsed, count, latest = item
+        print(f"      [{elapsed:5.1f}s] Reading #{count}: "
+              f"value={latest.data['value']:.6f}")
+
+
+def offer(updates, item):
+    """Queue an update, dropping the oldest one if the printer has fallen behind."""
+    while True:
+        try:
+            updates.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                updates.get_nowait()
+            except queue.Empty:
+                pass
+
+
 # ============================================================================
 # CONFIGURATION - EDIT THIS
 # ============================================================================
@@ -45,7 +72,8 @@ try:
     print(f"      Averaging: {config.averaging}")
     print(f"      ADC Rate: {config.adc_rate_hz} Hz")
     print(f"      Mode: {config.mode}")
-    print(f"      Sample period: {config.sample_period_s:.2f}s")
+    sample_period_s = config.sample_period_s
+    print(f"      Sample period: {sample_period_s:.2f}s")
     print()
 
     # Step 3: Start acquisition
@@ -55,55 +83,65 @@ try:
     print(f"      Collecting data for {RUN_DURATION_S}s...")
     print()
 
-    # Collect data and print live updates
-    start_time = time.time()
+    # Collect data; live updates are printed on a separate thread so a
+    # slow stdout never delays picking up the next reading
+    updates = queue.Queue(maxsize=8)
+    printer_thread = threading.Thread(target=printer, args=(updates,), daemon=True)
+    printer_thread.start()
+
+    start_time = time.monotonic()
+    deadline = start_time + RUN_DURATION_S
     last_count = 0
 
-    while time.time() - start_time < RUN_DURATION_S:
-        time.sleep(0.5)
-        readings = controller.read_buffer_snapshot()
-        if len(readings) > last_count:
-            latest = readings[-1]
-            elapsed = time.time() - start_time
-            print(f"      [{elapsed:5.1f}s] Reading #{len(readings)}: "
-                  f"value={latest.data['value']:.6f}")
-            last_count = len(readings)
+    while (now := time.monotonic()) < deadline:
+        # Wake as soon as a reading lands instead of polling every 0.5s
+        if not controller.wait_for_reading(timeout=min(0.5, deadline - now)):
+            continue
+        count = controller.buffer_len()
+        if count > last_count:
+            elapsed = time.monotonic() - start_time
+            offer(updates, (elapsed, count, controller.get_reading(-1)))
+            last_count = count
+
+    updates.put(None)
+    printer_thread.join(timeout=2.0)
 
     # Step 4: Results
     print()
     print("[4/4] Test complete! Analyzing results...")
-    final_readings = controller.read_buffer_snapshot()
+    final = controller.read_buffer_array()
 
-    print(f"      Total readings: {len(final_readings)}")
-    print(f"      Expected: ~{int(RUN_DURATION_S / config.sample_period_s)} "
+    print(f"      Total readings: {len(final)}")
+    print(f"      Expected: ~{int(RUN_DURATION_S / sample_period_s)} "
           f"(±1-2 due to timing)")
     print()
 
-    if final_readings:
+    if len(final):
+        first, last = controller.get_reading(0), controller.get_reading(-1)
         print("      First reading:")
-        print(f"        Timestamp: {final_readings[0].ts.isoformat()}")
-        print(f"        Value: {final_readings[0].data['value']:.6f}")
+        print(f"        Timestamp: {first.ts.isoformat()}")
+        print(f"        Value: {first.data['value']:.6f}")
         print()
         print("      Last reading:")
-        print(f"        Timestamp: {final_readings[-1].ts.isoformat()}")
-        print(f"        Value: {final_readings[-1].data['value']:.6f}")
+        print(f"        Timestamp: {last.ts.isoformat()}")
+        print(f"        Value: {last.data['value']:.6f}")
         print()
 
     # Calculate actual rate
-    if len(final_readings) >= 2:
-        time_span = (final_readings[-1].ts - final_readings[0].ts).total_seconds()
-        actual_rate = (len(final_readings) - 1) / time_span if time_span > 0 else 0
+    if len(final) >= 2:
+        time_span = (final["ts"][-1] - final["ts"][0]).astype("f8") / 1e6
+        actual_rate = (len(final) - 1) / time_span if time_span > 0 else 0
         print(f"      Measured rate: {actual_rate:.2f} Hz")
-        print(f"      Expected rate: {1.0 / config.sample_period_s:.2f} Hz")
+        print(f"      Expected rate: {1.0 / sample_period_s:.2f} Hz")
         print()
 
     # Validation
-    expected_count = int(RUN_DURATION_S / config.sample_period_s)
-    if expected_count - 2 <= len(final_readings) <= expected_count + 2:
+    expected_count = int(RUN_DURATION_S / sample_period_s)
+    if expected_count - 2 <= len(final) <= expected_count + 2:
         print("✓ PASS: Reading count within expected range")
     else:
         print("✗ FAIL: Reading count outside expected range")
-        print(f"  Expected {expected_count} ±2, got {len(final_readings)}")
+        print(f"  Expected {expected_count} ±2, got {len(final)}")
 
 finally:
     controller.disconnect()
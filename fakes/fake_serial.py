@@ -10,6 +10,8 @@ import threading
 import time
 from typing import Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +45,36 @@ class FakeSerial:
         self.firmware_version = firmware_version
         self.quiet_mode = quiet_mode
 
+        # Output queue for lines to send to "host"
+        self._output_queue: queue.Queue[bytes] = queue.Queue()
+
+        # Bytes already taken off the output queue but not yet read by host
+        self._read_pending = bytearray()
+
+        # Input buffer for commands from "host"
+        self._input_buffer = bytearray()
+
+        # Freerun streaming clock: lines are generated lazily, when the host
+        # reads, for every sample period elapsed since _stream_start
+        self._stream_lock = threading.Lock()
+        self._stream_start: Optional[float] = None  # None while not streaming
+        self._stream_period = 0.0
+        self._stream_sent = 0
+        self._stream_rng = np.random.default_rng()
+
+        self.timeout = 0.5  # Readline timeout (matches Transport default)
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Return the device to its power-on state, keeping its identity.
+
+        Stops streaming, clears both directions of buffered I/O, restores
+        the default configuration, and reopens the port, so one instance
+        can be reused across tests instead of being rebuilt.
+        """
+        self._stop_streaming()
+
         # Configuration state (stored in simulated EEPROM)
         self.averaging = 125
         self.adc_rate_hz = 125
@@ -58,19 +90,13 @@ class FakeSerial:
         self._sampling_started = False  # For polled mode initialization
         self._last_menu_cmd: Optional[str] = None  # Track last menu command for context
 
-        # Output queue for lines to send to "host"
-        self._output_queue: queue.Queue[bytes] = queue.Queue()
-
-        # Input buffer for commands from "host"
-        self._input_buffer = bytearray()
-
-        # Threading for freerun streaming
-        self._stream_thread: Optional[threading.Thread] = None
-        self._stop_streaming = threading.Event()
+        with self._output_queue.mutex:
+            self._output_queue.queue.clear()
+        self._read_pending.clear()
+        self._input_buffer.clear()
 
         # Port state
         self.is_open = True
-        self.timeout = 0.5  # Readline timeout (matches Transport default)
 
         # Start in init state - will send banner on first interaction
         self._initial_startup = True
@@ -78,7 +104,7 @@ class FakeSerial:
     def close(self) -> None:
         """Close the fake serial port."""
         self.is_open = False
-        self._stop_streaming_thread()
+        self._stop_streaming()
         logger.debug("FakeSerial closed")
 
     def write(self, data: bytes) -> int:
@@ -103,10 +129,45 @@ class FakeSerial:
 
         return len(data)
 
+    @property
+    def in_waiting(self) -> int:
+        """Number of output bytes available to the host without blocking."""
+        self._emit_due_lines()
+        with self._output_queue.mutex:
+            queued = sum(len(line) for line in self._output_queue.queue)
+        return len(self._read_pending) + queued
+
     def read(self, size: int = 1) -> bytes:
-        """Read bytes from device output (not commonly used in practice)."""
-        # For simplicity, we mainly support readline()
-        return b""
+        """Read up to size bytes from device output.
+
+        Blocks (up to the same 0.2s as readline) only while nothing is
+        pending, then drains as many queued lines as fit in size.
+
+        Args:
+            size: Maximum number of bytes to return
+
+        Returns:
+            Bytes read, or b"" on timeout
+        """
+        if not self.is_open:
+            raise RuntimeError("Port is closed")
+
+        pending = self._read_pending
+        if not pending:
+            block = self._next_output(timeout=0.2)
+            if block is None:
+                return b""
+            pending += block
+
+        while len(pending) < size:
+            try:
+                pending += self._output_queue.get_nowait()
+            except queue.Empty:
+                break
+
+        data = bytes(pending[:size])
+        del pending[:size]
+        return data
 
     def readline(self) -> bytes:
         """Read one line from device output.
@@ -117,13 +178,21 @@ class FakeSerial:
         if not self.is_open:
             raise RuntimeError("Port is closed")
 
-        try:
-            # Non-blocking read with short timeout
-            line = self._output_queue.get(timeout=0.2)
-            logger.debug(f"FakeSerial sending line: {line!r}")
-            return line
-        except queue.Empty:
-            return b""
+        pending = self._read_pending
+        idx = pending.find(b"\n")
+        if idx < 0:
+            # Wait briefly for more output
+            block = self._next_output(timeout=0.2)
+            if block is None:
+                return b""
+            pending += block
+            idx = pending.find(b"\n")
+
+        end = idx + 1 if idx >= 0 else len(pending)
+        line = bytes(pending[:end])
+        del pending[:end]
+        logger.debug(f"FakeSerial sending line: {line!r}")
+        return line
 
     def flush(self) -> None:
         """Flush output buffer (no-op for fake serial)."""
@@ -418,8 +487,8 @@ class FakeSerial:
         """Handle ESC or ? interrupt - stop streaming and enter menu."""
         logger.debug("Interrupt received, entering menu")
 
-        # Stop freerun thread if running
-        self._stop_streaming_thread()
+        # Stop freerun streaming if running
+        self._stop_streaming()
 
         # Enter menu state
         self._state = "menu"
@@ -440,7 +509,7 @@ class FakeSerial:
         logger.debug("Device resetting...")
 
         # Stop any streaming
-        self._stop_streaming_thread()
+        self._stop_streaming()
         self._sampling_started = False
 
         # Send power-on banner
@@ -461,8 +530,8 @@ class FakeSerial:
             self._send_line("Start free run sampling")
             self._send_line(f"Starting Sampling; quiet mode ={1 if self.quiet_mode else 0}")
 
-        # Start streaming thread
-        self._start_streaming_thread()
+        # Start the freerun clock
+        self._start_streaming()
         logger.debug("Entered freerun mode")
 
     def _enter_polled_mode(self) -> None:
@@ -567,24 +636,27 @@ class FakeSerial:
         )
         self._send_line(csv)
 
-    def _send_freerun_data_line(self) -> None:
-        """Generate and send one freerun data line."""
-        # Simulate sensor reading
-        import random
-
-        value = 100.0 + random.uniform(-5, 5)
+    def _freerun_data_lines(self, count: int, rng: np.random.Generator) -> bytes:
+        """Generate count freerun data lines as one CRLF-terminated block.
 
-        line = f"{self.preamble}{value:.6f}"
+        Values for the whole block are drawn in one call per column and
+        formatted through a single per-line template.
+        """
+        # Simulate sensor readings
+        columns = [100.0 + rng.uniform(-5, 5, count)]
+        template = f"{self.preamble}{{:.6f}}"
 
         if self.include_temp:
-            temp = 21.0 + random.uniform(-1, 1)
-            line += f", {temp:.2f}"
+            columns.append(21.0 + rng.uniform(-1, 1, count))
+            template += ", {:.2f}"
 
         if self.include_vin:
-            vin = 12.3 + random.uniform(-0.2, 0.2)
-            line += f", {vin:.3f}"
+            columns.append(12.3 + rng.uniform(-0.2, 0.2, count))
+            template += ", {:.3f}"
 
-        self._send_line(line)
+        template += "\r\n"
+        rows = zip(*(col.tolist() for col in columns))
+        return "".join([template.format(*row) for row in rows]).encode("ascii")
 
     def _send_polled_data_line(self) -> None:
         """Generate and send one polled data line (prefixed with TAG)."""
@@ -605,37 +677,67 @@ class FakeSerial:
         self._send_line(line)
 
     # ========================================================================
-    # Internal: Threading
+    # Internal: Freerun Streaming
     # ========================================================================
 
-    def _start_streaming_thread(self) -> None:
-        """Start background thread to generate freerun data."""
-        self._stop_streaming.clear()
-        self._stream_thread = threading.Thread(
-            target=self._streaming_loop,
-            name="FakeSensorStream",
-            daemon=True,
-        )
-        self._stream_thread.start()
-        logger.debug("Started freerun streaming thread")
-
-    def _stop_streaming_thread(self) -> None:
-        """Stop streaming thread if running."""
-        if self._stream_thread and self._stream_thread.is_alive():
-            self._stop_streaming.set()
-            self._stream_thread.join(timeout=2.0)
-            self._stream_thread = None
-            logger.debug("Stopped streaming thread")
-
-    def _streaming_loop(self) -> None:
-        """Background loop to send freerun data lines."""
-        # Calculate sample period
-        period = self.averaging / self.adc_rate_hz
+    def _start_streaming(self) -> None:
+        """Start the freerun clock; the first line is due immediately."""
+        with self._stream_lock:
+            self._stream_period = self.averaging / self.adc_rate_hz
+            self._stream_sent = 0
+            self._stream_start = time.monotonic()
+        logger.debug(f"Freerun streaming started, period={self._stream_period:.3f}s")
+
+    def _stop_streaming(self) -> None:
+        """Stop the freerun clock, queueing any lines that fell due before now."""
+        self._emit_due_lines()
+        with self._stream_lock:
+            if self._stream_start is not None:
+                self._stream_start = None
+                logger.debug("Freerun streaming stopped")
+
+    def _emit_due_lines(self) -> None:
+        """Queue, as one block, every freerun line that has fallen due.
+
+        Lines fall due on a fixed schedule of one per sample period from
+        _stream_start, so the rate does not drift with how often the host reads.
+        """
+        with self._stream_lock:
+            if self._stream_start is None:
+                return
+            due = int((time.monotonic() - self._stream_start) / self._stream_period) + 1
+            if due > self._stream_sent:
+                count = due - self._stream_sent
+                self._output_queue.put(self._freerun_data_lines(count, self._stream_rng))
+                self._stream_sent = due
 
-        logger.debug(f"Streaming loop started, period={period:.3f}s")
+    def _next_output(self, timeout: float) -> Optional[bytes]:
+        """Take the next block of device output, waiting up to timeout for one.
 
-        while not self._stop_streaming.is_set():
-            self._send_freerun_data_line()
-            time.sleep(period)
+        Menu replies are queued as soon as a command is written; freerun lines
+        are generated here once due, so waits are cut short at the next line's
+        due time instead of a background thread waking up for every sample.
 
-        logger.debug("Streaming loop stopped")
+        Returns:
+            Output bytes, or None if nothing arrived before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            self._emit_due_lines()
+            try:
+                return self._output_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            wait = deadline - now
+            if wait <= 0:
+                return None
+            with self._stream_lock:
+                if self._stream_start is not None:
+                    next_due = self._stream_start + self._stream_sent * self._stream_period
+                    wait = min(wait, max(next_due - now, 0.0))
+            try:
+                return self._output_queue.get(timeout=wait)
+            except queue.Empty:
+                continue
@@ -1,11 +1,14 @@
 """High-level controller for Q-Series sensor with state management."""
 
 import logging
+import os
 import threading
 import time
 from datetime import datetime, timezone
 from typing import Literal, Optional
 
+import numpy as np
+
 from q_sensor_lib import parsing, protocol
 from q_sensor_lib.errors import (
     DeviceResetError,
@@ -52,6 +55,9 @@ class SensorController:
         self._reader_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
 
+        # Set by the reader thread whenever a reading is buffered
+        self._reading_available = threading.Event()
+
         # Lock for state transitions
         self._state_lock = threading.Lock()
 
@@ -62,6 +68,7 @@ class SensorController:
         # Store state before pause for resume
         self._paused_from_state: Optional[ConnectionState] = None
         self._last_poll_hz: float = 1.0  # Default poll rate for resume
+        self._realtime: bool = False  # Reader threads request RT priority (also on resume)
 
     # ========================================================================
     # Connection Management
@@ -176,11 +183,7 @@ class SensorController:
             SerialIOError: If not in CONFIG_MENU state
         """
         self._ensure_in_menu()
-
-        if not (protocol.AVERAGING_MIN <= n <= protocol.AVERAGING_MAX):
-            raise InvalidConfigValue(
-                f"Averaging must be {protocol.AVERAGING_MIN}-{protocol.AVERAGING_MAX}, got {n}"
-            )
+        self._check_averaging(n)
 
         logger.info(f"Setting averaging to {n}...")
         assert self._transport is not None
@@ -241,11 +244,7 @@ class SensorController:
             SerialIOError: If not in CONFIG_MENU state
         """
         self._ensure_in_menu()
-
-        if rate_hz not in protocol.VALID_ADC_RATES:
-            raise InvalidConfigValue(
-                f"ADC rate must be one of {protocol.VALID_ADC_RATES}, got {rate_hz}"
-            )
+        self._check_adc_rate(rate_hz)
 
         logger.info(f"Setting ADC rate to {rate_hz} Hz...")
         assert self._transport is not None
@@ -315,15 +314,7 @@ class SensorController:
             SerialIOError: If not in CONFIG_MENU state
         """
         self._ensure_in_menu()
-
-        if mode not in ("freerun", "polled"):
-            raise InvalidConfigValue(f"Mode must be 'freerun' or 'polled', got '{mode}'")
-
-        if mode == "polled":
-            if not tag or len(tag) != 1 or tag not in protocol.VALID_TAGS:
-                raise InvalidConfigValue(
-                    f"Tag must be single uppercase A-Z for polled mode, got '{tag}'"
-                )
+        self._check_mode(mode, tag)
 
         logger.info(f"Setting mode to {mode}" + (f" with tag '{tag}'" if tag else ""))
         assert self._transport is not None
@@ -379,11 +370,93 @@ class SensorController:
         logger.info(f"Mode set to {mode}" + (f" with tag {tag}" if tag else ""))
         return self.get_config()
 
+    def set_config(
+        self,
+        averaging: Optional[int] = None,
+        adc_rate_hz: Optional[int] = None,
+        mode: Optional[Literal["freerun", "polled"]] = None,
+        tag: Optional[str] = None,
+    ) -> SensorConfig:
+        """Apply several configuration changes in one call.
+
+        Every value is validated before anything is sent, so an invalid
+        argument leaves the device untouched rather than half-configured.
+        Fields that are None or already match the cached config are skipped;
+        the rest are applied in order (averaging, ADC rate, mode), each as
+        one menu exchange. The firmware only accepts a value after its own
+        prompt, so the exchanges cannot be merged into a single write.
+
+        Args:
+            averaging: Averaging count (1-65535)
+            adc_rate_hz: ADC sample rate in Hz (see set_adc_rate)
+            mode: "freerun" or "polled"
+            tag: Single uppercase character A-Z (required if mode="polled")
+
+        Returns:
+            Updated SensorConfig
+
+        Raises:
+            InvalidConfigValue: If any value is invalid or the device rejects it
+            SerialIOError: If not in CONFIG_MENU state
+        """
+        self._ensure_in_menu()
+        if averaging is not None:
+            self._check_averaging(averaging)
+        if adc_rate_hz is not None:
+            self._check_adc_rate(adc_rate_hz)
+        if mode is not None:
+            self._check_mode(mode, tag)
+
+        # Decide up front: the set_* calls update the cached config in place
+        current = self.get_config()
+        set_averaging = averaging is not None and averaging != current.averaging
+        set_rate = adc_rate_hz is not None and adc_rate_hz != current.adc_rate_hz
+        set_mode = mode is not None and (
+            mode != current.mode or (mode == "polled" and tag != current.tag)
+        )
+
+        if set_averaging:
+            self.set_averaging(averaging)  # type: ignore[arg-type]
+        if set_rate:
+            self.set_adc_rate(adc_rate_hz)  # type: ignore[arg-type]
+        if set_mode:
+            self.set_mode(mode, tag=tag)  # type: ignore[arg-type]
+
+        return self.get_config()
+
+    @staticmethod
+    def _check_averaging(n: int) -> None:
+        """Raise InvalidConfigValue if n is not a valid averaging count."""
+        if not (protocol.AVERAGING_MIN <= n <= protocol.AVERAGING_MAX):
+            raise InvalidConfigValue(
+                f"Averaging must be {protocol.AVERAGING_MIN}-{protocol.AVERAGING_MAX}, got {n}"
+            )
+
+    @staticmethod
+    def _check_adc_rate(rate_hz: int) -> None:
+        """Raise InvalidConfigValue if rate_hz is not a supported ADC rate."""
+        if rate_hz not in protocol.VALID_ADC_RATES:
+            raise InvalidConfigValue(
+                f"ADC rate must be one of {protocol.VALID_ADC_RATES}, got {rate_hz}"
+            )
+
+    @staticmethod
+    def _check_mode(mode: str, tag: Optional[str]) -> None:
+        """Raise InvalidConfigValue if mode, or the tag polled mode needs, is invalid."""
+        if mode not in ("freerun", "polled"):
+            raise InvalidConfigValue(f"Mode must be 'freerun' or 'polled', got '{mode}'")
+
+        if mode == "polled":
+            if not tag or len(tag) != 1 or tag not in protocol.VALID_TAGS:
+                raise InvalidConfigValue(
+                    f"Tag must be single uppercase A-Z for polled mode, got '{tag}'"
+                )
+
     # ========================================================================
     # Acquisition Control
     # ========================================================================
 
-    def start_acquisition(self, poll_hz: float = 1.0) -> None:
+    def start_acquisition(self, poll_hz: float = 1.0, realtime: bool = False) -> None:
         """Exit menu and start data acquisition in configured mode.
 
         Sends 'X' command which triggers device reset. After reset, device
@@ -395,6 +468,11 @@ class SensorController:
 
         Args:
             poll_hz: Polling rate for polled mode (1-15 Hz recommended). Ignored in freerun.
+            realtime: Best-effort SCHED_FIFO scheduling for the reader thread, so
+                its ticks are not delayed by other busy threads. Needs Linux and
+                CAP_SYS_NICE (or an RLIMIT_RTPRIO allowance); otherwise a lower nice
+                value is tried, and acquisition runs at normal priority if both
+                are refused.
 
         Raises:
             SerialIOError: If not in CONFIG_MENU state or already acquiring
@@ -422,6 +500,7 @@ class SensorController:
         self._transport.flush_input()
 
         # Start appropriate acquisition mode
+        self._realtime = realtime
         with self._state_lock:
             if config.mode == "freerun":
                 self._state = ConnectionState.ACQ_FREERUN
@@ -565,6 +644,80 @@ class SensorController:
         """
         return self._buffer.snapshot()
 
+    def read_buffer_array(
+        self, max_n: Optional[int] = None, since: Optional[datetime] = None
+    ) -> np.ndarray:
+        """Get buffered readings as a structured numpy array.
+
+        Cheaper than read_buffer_snapshot() for bulk math (rates, spans,
+        statistics) because no Reading objects are materialized. Fields are
+        ts (UTC datetime64[us]), value, and mode (see ring_buffer.MODE_CODES).
+
+        Args:
+            max_n: Return at most this many of the newest readings
+            since: Only return readings with ts strictly after this time,
+                e.g. the last ts a consumer has already seen
+
+        Returns:
+            Structured array ordered oldest to newest
+        """
+        return self._buffer.snapshot_array(max_n=max_n, since=since)
+
+    def buffer_len(self) -> int:
+        """Get the number of buffered readings without copying the buffer.
+
+        Returns:
+            Number of readings currently buffered
+        """
+        return len(self._buffer)
+
+    def get_reading(self, index: int) -> Reading:
+        """Get one buffered reading by position without copying the buffer.
+
+        Args:
+            index: Position, oldest first; -1 is the most recent reading
+
+        Returns:
+            Reading at that position
+
+        Raises:
+            IndexError: If index is out of range (e.g., buffer is empty)
+        """
+        return self._buffer.get(index)
+
+    def wait_for_reading(self, timeout: Optional[float] = None) -> bool:
+        """Block until a new reading is buffered, or timeout.
+
+        Intended for a single consumer loop (e.g., a live display): the
+        notification is consumed on return, so the next call waits for a
+        reading buffered after this one.
+
+        Args:
+            timeout: Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            True if a reading arrived, False on timeout
+        """
+        if self._reading_available.wait(timeout):
+            self._reading_available.clear()
+            return True
+        return False
+
+    def wait_for_samples(self, n: int, timeout: Optional[float] = 5.0) -> bool:
+        """Block until at least n readings are buffered, or timeout.
+
+        Unlike wait_for_reading(), nothing is consumed, so any number of
+        threads can wait on the same count.
+
+        Args:
+            n: Buffered reading count to wait for (at most the buffer size)
+            timeout: Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            True if n readings are buffered, False on timeout
+        """
+        return self._buffer.wait_for_len(n, timeout)
+
     def clear_buffer(self) -> None:
         """Clear all buffered readings."""
         self._buffer.clear()
@@ -577,8 +730,7 @@ class SensorController:
         Returns:
             Latest Reading instance or None
         """
-        snapshot = self._buffer.snapshot()
-        return snapshot[-1] if snapshot else None
+        return self._buffer.latest()
 
     @property
     def state(self) -> ConnectionState:
@@ -790,6 +942,26 @@ class SensorController:
 
             self._reader_thread = None
 
+    @staticmethod
+    def _raise_thread_priority() -> None:
+        """Best-effort real-time priority for the calling reader thread.
+
+        On Linux both calls below act on the calling thread only, not the
+        whole process. Failures are logged and acquisition carries on.
+        """
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+            logger.info("Reader thread scheduled SCHED_FIFO (priority 10)")
+            return
+        except (AttributeError, OSError) as e:
+            logger.debug(f"SCHED_FIFO unavailable ({e}), trying nice")
+
+        try:
+            os.nice(-5)
+            logger.info("Reader thread niceness lowered by 5")
+        except (AttributeError, OSError) as e:
+            logger.warning(f"Could not raise reader thread priority: {e}")
+
     def _freerun_reader_loop(self) -> None:
         """Background thread loop for freerun mode.
 
@@ -797,6 +969,9 @@ class SensorController:
         """
         logger.info(f"Freerun reader loop started (thread {threading.get_ident()})")
         assert self._transport is not None
+        if self._realtime:
+            self._raise_thread_priority()
+        is_noise = protocol.RE_FREERUN_NOISE.search
 
         while not self._stop_event.is_set():
             try:
@@ -806,27 +981,7 @@ class SensorController:
 
                 # Filter out known menu/banner/diagnostic lines before attempting parse
                 # These appear after 'X' command due to device reset
-                menu_markers = [
-                    "Select the letter of",
-                    " to set ",
-                    "Operating in",
-                    "ADC sample rate",
-                    "Averaging",
-                    "Sensor temperature:",
-                    "Input Supply Voltage",
-                    "Calfactor:",
-                    "Reset ADC",
-                    "Start free run",
-                    "Starting Sampling",
-                    "Biospherical Instruments",
-                    "Digital Engine",
-                    "Unit ID",
-                    "Rebooting program",
-                    "gain ",
-                    "Buffer disabled",
-                ]
-
-                if any(marker in line for marker in menu_markers):
+                if is_noise(line):
                     logger.debug(f"Skipping menu/diagnostic line: {line[:60]}")
                     continue
 
@@ -840,7 +995,8 @@ class SensorController:
                         data=data,
                     )
                     self._buffer.append(reading)
-                    logger.debug(f"Freerun reading: {data}")
+                    self._reading_available.set()
+                    logger.debug("Freerun reading: %s", data)
 
                 except InvalidResponse as e:
                     # Line might be banner noise or error - log but continue
@@ -870,49 +1026,60 @@ class SensorController:
         """
         logger.info(f"Polled reader loop started (thread {threading.get_ident()}) at {poll_hz} Hz")
         assert self._transport is not None
-
-        poll_period = 1.0 / poll_hz
-        query_cmd = protocol.make_polled_query_cmd(tag)
-
+        if self._realtime:
+            self._raise_thread_priority()
+
+        # Integer nanoseconds: adding the period never accumulates rounding error
+        period_ns = round(1e9 / poll_hz)
+        # The query never changes during a run, so it is encoded once here
+        query_bytes = protocol.make_polled_query_cmd(tag).encode("ascii")
+        write_bytes = self._transport.write_bytes
+        readline = self._transport.readline
+        monotonic_ns = time.monotonic_ns
+
+        # Queries go out on absolute ticks (next_tick += period), so the time
+        # spent waiting for and parsing each response never accumulates as drift
+        next_tick = monotonic_ns()
         while not self._stop_event.is_set():
-            cycle_start = time.time()
-
             try:
                 # Send query (>A* format, no CR - verified with logic analyzer)
-                self._transport.write_bytes(query_cmd.encode("ascii"))
+                write_bytes(query_bytes)
 
                 # Read response with timeout
-                line = self._transport.readline()
+                line = readline()
                 if not line:
                     logger.warning("No response to polled query, will retry")
-                    # Micro-fix #4: Use Event.wait for cancellable sleep
-                    if self._stop_event.wait(timeout=poll_period):
-                        break  # Stop event set during sleep
-                    continue
-
-                # Parse polled line (Critical Fix #5: TAG validation already in parsing.py)
-                try:
-                    data = parsing.parse_polled_line(line, tag)
-                    reading = Reading(
-                        ts=datetime.now(timezone.utc),
-                        sensor_id=self._sensor_id,
-                        mode="polled",
-                        data=data,
-                    )
-                    self._buffer.append(reading)
-                    logger.debug(f"Polled reading: {data}")
-
-                except InvalidResponse as e:
-                    logger.warning(f"Failed to parse polled response: {e}")
+                else:
+                    # Parse polled line (Critical Fix #5: TAG validation already in parsing.py)
+                    try:
+                        data = parsing.parse_polled_line(line, tag)
+                        reading = Reading(
+                            ts=datetime.now(timezone.utc),
+                            sensor_id=self._sensor_id,
+                            mode="polled",
+                            data=data,
+                        )
+                        self._buffer.append(reading)
+                        self._reading_available.set()
+                        logger.debug("Polled reading: %s", data)
+
+                    except InvalidResponse as e:
+                        logger.warning(f"Failed to parse polled response: {e}")
 
             except Exception as e:
                 logger.error(f"Error in polled reader loop: {e}", exc_info=True)
 
+            # A late cycle polls again at once; ticks it overran entirely are
+            # dropped (and logged) rather than fired back to back
+            next_tick += period_ns
+            now = monotonic_ns()
+            if now - next_tick >= period_ns:
+                missed = (now - next_tick) // period_ns
+                next_tick += missed * period_ns
+                logger.debug("Polled reader missed %d tick(s)", missed)
+
             # Micro-fix #4: Use Event.wait for cancellable sleep
-            elapsed = time.time() - cycle_start
-            sleep_time = max(0, poll_period - elapsed)
-            if sleep_time > 0:
-                if self._stop_event.wait(timeout=sleep_time):
-                    break  # Stop event set during sleep
+            if self._stop_event.wait(timeout=max(next_tick - now, 0) / 1e9):
+                break  # Stop event set during sleep
 
         logger.info("Polled reader loop stopped")
@@ -1,9 +1,10 @@
 """Data models for Q-Series sensor library."""
 
+import math
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Literal, Optional
+from typing import Dict, Literal, Optional, Tuple
 
 
 class ConnectionState(Enum):
@@ -76,10 +77,13 @@ class SensorConfig:
         return self.averaging / self.adc_rate_hz
 
 
-@dataclass
+@dataclass(slots=True)
 class Reading:
     """A single sensor reading with timestamp and metadata.
 
+    Slotted: readings are created per sample at stream rate, so instances
+    carry no per-object __dict__.
+
     Attributes:
         ts: UTC timestamp when reading was received/parsed.
         sensor_id: Sensor serial number or identifier.
@@ -98,6 +102,28 @@ class Reading:
         if "value" not in self.data:
             raise ValueError("Reading data must contain 'value' key")
 
+    def to_tuple(self) -> Tuple[datetime, str, str, float, float, float]:
+        """Convert reading to a flat row for columnar storage.
+
+        Returns:
+            (ts, sensor_id, mode, value, TempC, Vin), with absent optional
+            fields as NaN so numeric columns stay float
+
+        Raises:
+            ValueError: If data is missing the "value" key
+        """
+        data = self.data
+        if "value" not in data:
+            raise ValueError("Reading data must contain 'value' key")
+        return (
+            self.ts,
+            self.sensor_id,
+            self.mode,
+            data["value"],
+            data.get("TempC", math.nan),
+            data.get("Vin", math.nan),
+        )
+
     def to_dict(self) -> Dict[str, any]:
         """Convert reading to dictionary with ISO timestamp for API responses.
 
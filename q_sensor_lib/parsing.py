@@ -37,14 +37,15 @@ def parse_freerun_line(line: str) -> Dict[str, float]:
         raise InvalidResponse(f"Freerun line doesn't match expected pattern: {line!r}")
 
     # Group 1 is preamble (ignored), Group 2 is value, 3=temp, 4=vin
+    _, value, temp, vin = match.groups()
     try:
-        data: Dict[str, float] = {"value": float(match.group(2))}
+        data: Dict[str, float] = {"value": float(value)}
 
-        if match.group(3):  # Temperature present
-            data["TempC"] = float(match.group(3))
+        if temp:  # Temperature present
+            data["TempC"] = float(temp)
 
-        if match.group(4):  # Vin present
-            data["Vin"] = float(match.group(4))
+        if vin:  # Vin present
+            data["Vin"] = float(vin)
 
         return data
 
@@ -84,14 +85,15 @@ def parse_polled_line(line: str, expected_tag: str) -> Dict[str, float]:
         )
 
     # Group 2 is preamble (ignored), Group 3=value, 4=temp, 5=vin
+    _, _, value, temp, vin = match.groups()
     try:
-        data: Dict[str, float] = {"value": float(match.group(3))}
+        data: Dict[str, float] = {"value": float(value)}
 
-        if match.group(4):
-            data["TempC"] = float(match.group(4))
+        if temp:
+            data["TempC"] = float(temp)
 
-        if match.group(5):
-            data["Vin"] = float(match.group(5))
+        if vin:
+            data["Vin"] = float(vin)
 
         return data
 
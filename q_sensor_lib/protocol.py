@@ -210,6 +210,31 @@ RE_POLLED_LINE: Final[re.Pattern[str]] = re.compile(
     r"\s*$"
 )
 
+# Menu, banner, and diagnostic lines that can interleave with freerun data
+# (e.g., the device reset after 'X'). Matched by substring in one search.
+FREERUN_NOISE_MARKERS: Final[tuple[str, ...]] = (
+    "Select the letter of",
+    " to set ",
+    "Operating in",
+    "ADC sample rate",
+    "Averaging",
+    "Sensor temperature:",
+    "Input Supply Voltage",
+    "Calfactor:",
+    "Reset ADC",
+    "Start free run",
+    "Starting Sampling",
+    "Biospherical Instruments",
+    "Digital Engine",
+    "Unit ID",
+    "Rebooting program",
+    "gain ",
+    "Buffer disabled",
+)
+RE_FREERUN_NOISE: Final[re.Pattern[str]] = re.compile(
+    "|".join(re.escape(marker) for marker in FREERUN_NOISE_MARKERS)
+)
+
 # Configuration CSV dump from "^" command
 # Format (line 1670-1689):
 # <adcToAverage>,<baudrate>,<CalFactor>,<Description>,E,<Version>,G,H,<Serial>,...
@@ -3,12 +3,27 @@
 import logging
 import threading
 from collections import deque
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import Final, List, Optional
+
+import numpy as np
 
 from q_sensor_lib.models import Reading
 
 logger = logging.getLogger(__name__)
 
+# Columnar layout mirrored alongside the Reading objects (see snapshot_array)
+READING_DTYPE: Final = np.dtype(
+    [("ts", "datetime64[us]"), ("value", "f8"), ("mode", "u1")]
+)
+
+# Small integer codes stored in the "mode" column
+MODE_CODES: Final[dict[str, int]] = {"freerun": 0, "polled": 1}
+MODE_CODE_UNKNOWN: Final[int] = 255
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
 
 class RingBuffer:
     """Thread-safe fixed-size FIFO buffer for sensor readings.
@@ -28,8 +43,13 @@ class RingBuffer:
 
         self._buffer: deque[Reading] = deque(maxlen=maxlen)
         self._lock = threading.Lock()
+        self._appended = threading.Condition(self._lock)  # Notified on every append
         self._maxlen = maxlen
 
+        # Fixed-size columnar mirror of the buffer; _head is the next slot
+        self._columns = np.zeros(maxlen, dtype=READING_DTYPE)
+        self._head = 0
+
     def append(self, reading: Reading) -> None:
         """Append a reading to the buffer (thread-safe).
 
@@ -38,11 +58,27 @@ class RingBuffer:
         Args:
             reading: Reading instance to append
         """
+        ts = reading.ts
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        row = (
+            (ts - _EPOCH) // _ONE_US,
+            reading.data["value"],
+            MODE_CODES.get(reading.mode, MODE_CODE_UNKNOWN),
+        )
+
         with self._lock:
             self._buffer.append(reading)
+            self._columns[self._head] = row
+            self._head = (self._head + 1) % self._maxlen
+            size = len(self._buffer)
+            self._appended.notify_all()
+
+        # Format outside the lock, and only when DEBUG is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"Appended reading at {reading.ts.isoformat()}, "
-                f"buffer size: {len(self._buffer)}/{self._maxlen}"
+                f"buffer size: {size}/{self._maxlen}"
             )
 
     def snapshot(self) -> List[Reading]:
@@ -54,11 +90,88 @@ class RingBuffer:
         with self._lock:
             return list(self._buffer)
 
+    def snapshot_array(
+        self, max_n: Optional[int] = None, since: Optional[datetime] = None
+    ) -> np.ndarray:
+        """Get the buffered readings as a structured numpy array (thread-safe).
+
+        The array has READING_DTYPE fields (ts as UTC datetime64[us], value,
+        mode code) and is a copy, so it is safe to keep after the buffer
+        moves on. No Reading objects are touched, and only the requested
+        window of the columnar mirror is copied.
+
+        Args:
+            max_n: Return at most this many of the newest readings
+            since: Only return readings with ts strictly after this time
+                (naive datetimes are taken as UTC)
+
+        Returns:
+            Structured array ordered oldest to newest
+        """
+        with self._lock:
+            count = len(self._buffer)
+            n = count if max_n is None else max(min(max_n, count), 0)
+            start = (self._head - n) % self._maxlen
+            if start + n <= self._maxlen:
+                window = self._columns[start : start + n].copy()
+            else:
+                window = np.concatenate(
+                    (self._columns[start:], self._columns[: start + n - self._maxlen])
+                )
+
+        if since is not None:
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            since_us = np.datetime64((since - _EPOCH) // _ONE_US, "us")
+            window = window[window["ts"] > since_us]
+        return window
+
+    def wait_for_len(self, n: int, timeout: Optional[float] = None) -> bool:
+        """Block until the buffer holds at least n readings (thread-safe).
+
+        Woken by appends rather than polling. Since the buffer never holds
+        more than maxlen readings, n > maxlen only returns on timeout.
+
+        Args:
+            n: Reading count to wait for
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if n readings are buffered, False if the timeout expired first
+        """
+        with self._appended:
+            return self._appended.wait_for(lambda: len(self._buffer) >= n, timeout)
+
+    def latest(self) -> Optional[Reading]:
+        """Get the most recent reading without copying the buffer (thread-safe).
+
+        Returns:
+            Newest Reading, or None if buffer is empty
+        """
+        with self._lock:
+            return self._buffer[-1] if self._buffer else None
+
+    def get(self, index: int) -> Reading:
+        """Get a single reading by position without copying the buffer (thread-safe).
+
+        Args:
+            index: Position, oldest first; negative indexes count from newest
+
+        Returns:
+            Reading at that position
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        with self._lock:
+            return self._buffer[index]
+
     def clear(self) -> None:
         """Remove all readings from buffer (thread-safe)."""
         with self._lock:
             count = len(self._buffer)
             self._buffer.clear()
+            self._head = 0
             logger.debug(f"Cleared {count} readings from buffer")
 
     def __len__(self) -> int:
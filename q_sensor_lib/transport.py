@@ -1,13 +1,24 @@
 """Serial transport layer for Q-Series sensor communication."""
 
 import logging
+import select
+import sys
+import time
 from typing import Optional, Protocol
 
 from q_sensor_lib import protocol
 from q_sensor_lib.errors import SerialIOError
 
+if sys.platform != "win32":
+    import termios
+
 logger = logging.getLogger(__name__)
 
+# Driver queue sizes requested on Windows (SetupComm). The defaults are
+# small enough that a streamed burst can back up behind a pending write.
+WIN32_RX_BUFFER_SIZE = 65536
+WIN32_TX_BUFFER_SIZE = 8192
+
 
 class SerialLike(Protocol):
     """Protocol for serial port interface (allows test doubles)."""
@@ -24,6 +35,11 @@ class SerialLike(Protocol):
         """Read a line from serial port."""
         ...
 
+    @property
+    def in_waiting(self) -> int:
+        """Number of bytes available to read without blocking."""
+        ...
+
     def flush(self) -> None:
         """Flush output buffer (force transmission)."""
         ...
@@ -47,8 +63,17 @@ class Transport:
 
     Handles line termination, command formatting, and timeouts per
     the Q-Series protocol specification.
+
+    A port backed by a real file descriptor is switched to non-blocking reads
+    (its timeout is set to 0): reads wait on the fd with poll() against the
+    transport's own deadline, taken from the port's original timeout.
     """
 
+    # Encoded, CR-terminated commands keyed by text. The menu vocabulary is
+    # small ("A", "X", rate/averaging digits), so this rarely grows.
+    _CMD_CACHE: dict[str, bytes] = {}
+    _CMD_CACHE_MAX = 128
+
     def __init__(self, serial_port: SerialLike) -> None:
         """Initialize transport with a serial port instance.
 
@@ -57,6 +82,46 @@ class Transport:
                         (e.g., serial.Serial or FakeSerial for testing)
         """
         self._port = serial_port
+        # Cached open state: pyserial's is_open is a property getter, and
+        # it only changes through close(), which goes through us.
+        self._is_open: bool = bool(serial_port.is_open)
+
+        # Receive buffer shared by readline() and read_lines(); _scan_from is
+        # how far it has already been searched for a line terminator
+        self._rx_buf = bytearray()
+        self._scan_from = 0
+        self._has_in_waiting = hasattr(serial_port, "in_waiting")
+        self._read_timeout: float = (
+            getattr(serial_port, "timeout", None) or protocol.TIMEOUT_READ_LINE
+        )
+
+        # Ports backed by a real fd are waited on with poll() against our own
+        # deadline, so the caller's port is switched to non-blocking reads
+        self._poller = self._make_poller(serial_port) if self._has_in_waiting else None
+        if self._poller is not None:
+            serial_port.timeout = 0  # type: ignore[attr-defined]
+
+    @staticmethod
+    def _make_poller(serial_port: SerialLike) -> Optional["select.poll"]:
+        """Register the port's file descriptor for POLLIN, if it has one.
+
+        Args:
+            serial_port: Port to wait on
+
+        Returns:
+            poll object, or None if the port or platform does not support it
+        """
+        fileno = getattr(serial_port, "fileno", None)
+        if fileno is None or not hasattr(select, "poll"):
+            return None
+        try:
+            fd = fileno()
+        except Exception:
+            return None
+
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        return poller
 
     @classmethod
     def open(
@@ -92,6 +157,16 @@ class Transport:
                 dsrdtr=False,
                 xonxoff=False
             )
+            if sys.platform == "win32":
+                # pyserial already uses OVERLAPPED I/O on win32; size the driver
+                # queues so reads and API-thread writes do not stall each other
+                ser.set_buffer_size(
+                    rx_size=WIN32_RX_BUFFER_SIZE, tx_size=WIN32_TX_BUFFER_SIZE
+                )
+                ser.reset_input_buffer()
+            else:
+                # Drop bytes left in the tty queue by a previous session
+                termios.tcflush(ser.fd, termios.TCIFLUSH)
             logger.info(f"Opened serial port {port} at {baud} baud, timeout={timeout_s}s")
             return cls(ser)
         except Exception as e:
@@ -99,14 +174,15 @@ class Transport:
 
     def close(self) -> None:
         """Close the serial port."""
-        if self._port.is_open:
+        if self._is_open:
+            self._is_open = False
             self._port.close()
             logger.info("Closed serial port")
 
     @property
     def is_open(self) -> bool:
         """Check if port is currently open."""
-        return self._port.is_open
+        return self._is_open
 
     def write_bytes(self, data: bytes) -> None:
         """Write raw bytes to port (no automatic termination).
@@ -117,13 +193,14 @@ class Transport:
         Raises:
             SerialIOError: If write fails
         """
-        if not self._port.is_open:
+        if not self._is_open:
             raise SerialIOError("Serial port is not open")
 
         try:
             sent = self._port.write(data)
             self._port.flush()  # Force immediate transmission
-            logger.debug(f"Sent {sent} bytes: {data!r} (hex: {data.hex(' ')})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent %d bytes: %r (hex: %s)", sent, data, data.hex(" "))
         except Exception as e:
             raise SerialIOError(f"Failed to write to port: {e}") from e
 
@@ -138,46 +215,83 @@ class Transport:
         Raises:
             SerialIOError: If write fails
         """
-        data = text.encode("ascii") + protocol.INPUT_TERMINATOR
+        cache = self._CMD_CACHE
+        data = cache.get(text)
+        if data is None:
+            data = text.encode("ascii") + protocol.INPUT_TERMINATOR
+            if len(cache) >= self._CMD_CACHE_MAX:
+                cache.clear()
+            cache[text] = data
+        self.write_bytes(data)
+
+    def write_cmds(self, texts: list[str]) -> None:
+        """Write several text commands in a single write call.
+
+        Each command is CR-terminated exactly as write_cmd() would send it,
+        but the whole sequence goes out in one write+flush instead of one
+        per command. Only use this for sequences the device can consume
+        without waiting for an intermediate prompt.
+
+        Args:
+            texts: Command strings in send order (e.g., ["A", "125"])
+
+        Raises:
+            SerialIOError: If write fails
+        """
+        if not texts:
+            return
+
+        terminator = protocol.INPUT_TERMINATOR
+        data = terminator.join(t.encode("ascii") for t in texts) + terminator
         self.write_bytes(data)
 
     def readline(self, timeout: Optional[float] = None) -> Optional[str]:
         """Read one line from device, expecting CRLF termination.
 
         Device sends all output lines terminated with CRLF (0x0D 0x0A).
+        Bytes are drained from the port in blocks into an internal receive
+        buffer, so several lines arriving together cost one read call.
 
         Args:
-            timeout: Optional override for read timeout (unused in pyserial,
-                    timeout is set at port open time)
+            timeout: Optional override for the line timeout. Defaults to
+                    the port's read timeout.
 
         Returns:
-            Line as string with CRLF stripped, or None on timeout/no data
+            Line as string with CRLF stripped, or None on timeout/no data.
+            As with pyserial's readline(), an unterminated partial line is
+            returned once the timeout expires (e.g., prompts without CRLF).
 
         Raises:
             SerialIOError: If port is closed or read fails
         """
-        if not self._port.is_open:
+        if not self._is_open:
             raise SerialIOError("Serial port is not open")
 
-        try:
-            line_bytes = self._port.readline()
-            if not line_bytes:
-                return None
-
-            # Device sends CRLF; decode and strip
-            line = line_bytes.decode("ascii", errors="replace").rstrip("\r\n")
-            logger.debug(f"Received line: {line!r}")
-            return line
+        if timeout is None:
+            timeout = self._read_timeout
 
+        try:
+            line_bytes = self._read_line_bytes(time.monotonic() + timeout)
         except Exception as e:
             raise SerialIOError(f"Failed to read line: {e}") from e
 
+        if line_bytes is None:
+            return None
+
+        line = self._decode_line(line_bytes)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received line: %r", line)
+        return line
+
     def read_lines(self, count: int, timeout_per_line: float = 1.0) -> list[str]:
         """Read multiple lines, returning as soon as count is reached or timeout.
 
+        The whole batch shares one deadline of count * timeout_per_line and
+        is served from the same receive buffer as readline().
+
         Args:
             count: Number of lines to read
-            timeout_per_line: Timeout for each line
+            timeout_per_line: Timeout budget per line
 
         Returns:
             List of lines (may be shorter than count if timeout occurs)
@@ -185,12 +299,25 @@ class Transport:
         Raises:
             SerialIOError: If port is closed or read fails
         """
-        lines = []
-        for _ in range(count):
-            line = self.readline(timeout=timeout_per_line)
-            if line is None:
-                break
-            lines.append(line)
+        if not self._is_open:
+            raise SerialIOError("Serial port is not open")
+
+        deadline = time.monotonic() + count * timeout_per_line
+        lines: list[str] = []
+        read_line_bytes = self._read_line_bytes
+        decode_line = self._decode_line
+        append = lines.append
+        try:
+            for _ in range(count):
+                line_bytes = read_line_bytes(deadline)
+                if line_bytes is None:
+                    break
+                append(decode_line(line_bytes))
+        except Exception as e:
+            raise SerialIOError(f"Failed to read line: {e}") from e
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received %d lines: %r", len(lines), lines)
         return lines
 
     def flush_input(self) -> None:
@@ -201,11 +328,88 @@ class Transport:
         Raises:
             SerialIOError: If port is closed
         """
-        if not self._port.is_open:
+        if not self._is_open:
             raise SerialIOError("Serial port is not open")
 
         try:
+            self._rx_buf.clear()
+            self._scan_from = 0
             self._port.reset_input_buffer()
-            logger.debug("Flushed input buffer")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Flushed input buffer")
         except Exception as e:
             raise SerialIOError(f"Failed to flush input: {e}") from e
+
+    # ========================================================================
+    # Internal: Buffered Receive
+    # ========================================================================
+
+    def _read_line_bytes(self, deadline: float) -> Optional[bytes]:
+        """Pop one raw line from the receive buffer, reading until deadline.
+
+        Args:
+            deadline: time.monotonic() value after which to give up
+
+        Returns:
+            Raw line including terminator, a partial line if the deadline
+            passed mid-line, or None if nothing was received
+        """
+        if not self._has_in_waiting:
+            # Minimal ports without in_waiting delimit lines themselves
+            return self._port.readline() or None
+
+        # Bind hot lookups once; this loop runs per received chunk
+        buf = self._rx_buf
+        find = buf.find
+        port = self._port
+        read = port.read
+        poll = self._poller.poll if self._poller is not None else None
+        monotonic = time.monotonic
+
+        expired = False
+        while True:
+            # Split on LF like pyserial's readline(); CR is trimmed on decode.
+            # Resume where the last scan stopped so bytes of a partially
+            # received line are never searched twice.
+            idx = find(b"\n", self._scan_from)
+            if idx >= 0:
+                line = bytes(buf[: idx + 1])
+                del buf[: idx + 1]
+                self._scan_from = 0
+                return line
+            self._scan_from = len(buf)
+
+            if expired:
+                break
+
+            if poll is None:
+                # Whatever is available, blocking for at most one byte
+                chunk = read(port.in_waiting or 1)
+            else:
+                # Wait on the fd with the time actually left, then read what
+                # arrived (the port is non-blocking, so read() never stalls)
+                remaining_ms = (deadline - monotonic()) * 1000.0
+                if remaining_ms > 0 and poll(remaining_ms):
+                    chunk = read(port.in_waiting or 1)
+                else:
+                    chunk = b""
+            if chunk:
+                buf += chunk
+            expired = monotonic() >= deadline
+
+        if buf:
+            line = bytes(buf)
+            buf.clear()
+            self._scan_from = 0
+            return line
+        return None
+
+    @staticmethod
+    def _decode_line(line_bytes: bytes) -> str:
+        """Trim the line terminator and decode as ASCII."""
+        end = len(line_bytes)
+        if line_bytes.endswith(protocol.OUTPUT_TERMINATOR):
+            end -= 2
+        elif line_bytes[-1:] in (b"\r", b"\n"):
+            end -= 1
+        return line_bytes[:end].decode("ascii", errors="replace")
@@ -0,0 +1,15 @@
+"""Shared pytest hooks for the test suite."""
+
+import pytest
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    """Attach each phase's report to the item (rep_setup, rep_call, rep_teardown).
+
+    Lets fixtures that share state across a module see in teardown whether
+    their test failed, and clean up only then.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
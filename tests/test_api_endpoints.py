@@ -11,56 +11,90 @@ Tests verify:
 - Request limits (recent capped at 300s)
 """
 
-import time
+import asyncio
+import functools
 from pathlib import Path
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
 # Import API app and reset singletons for testing
 from api import main as api_module
+from data_store import DataRecorder
 from fakes.fake_serial import FakeSerial
+from q_sensor_lib import protocol
+from q_sensor_lib.errors import InvalidConfigValue, MenuTimeout, SerialIOError
 from q_sensor_lib.transport import Transport
 
+# Schema keys checked on /latest readings and /recent rows
+EXPECTED_ROW_KEYS = frozenset({"timestamp", "sensor_id", "mode", "value"})
+EXPECTED_RECENT_KEYS = frozenset({"timestamp", "value", "mode"})
+
 
 @pytest.fixture(autouse=True)
-def reset_singletons():
-    """Reset global singletons before each test."""
-    api_module._controller = None
-    api_module._store = None
-    api_module._recorder = None
+def reset_singletons(monkeypatch, tmp_path):
+    """Roll the API globals back to the disconnected state around each test.
+
+    The globals are patched to None and restored by monkeypatch, so teardown
+    only has to stop what the test actually started; tests that never
+    connect pay nothing. Exports land in the test's own tmp_path, so
+    parallel workers never share a directory.
+    """
+    monkeypatch.setattr(api_module, "EXPORT_PATH", str(tmp_path))
+    monkeypatch.setattr(api_module, "_controller", None)
+    monkeypatch.setattr(api_module, "_store", None)
+    monkeypatch.setattr(api_module, "_recorder", None)
     yield
-    # Cleanup after test
-    if api_module._recorder and api_module._recorder.is_running():
-        api_module._recorder.stop()
-    if api_module._controller and api_module._controller.is_connected():
+
+    recorder = api_module._recorder
+    if recorder is not None and recorder.is_running():
+        recorder.stop()
+
+    controller = api_module._controller
+    if controller is not None and controller.is_connected():
         try:
-            if api_module._controller.state.value in ("acq_freerun", "acq_polled"):
-                api_module._controller.stop()
-            api_module._controller.disconnect()
+            if controller.state.value in ("acq_freerun", "acq_polled"):
+                controller.stop()
+            controller.disconnect()
         except Exception:
             pass
-    api_module._controller = None
-    api_module._store = None
-    api_module._recorder = None
 
+    store = api_module._store
+    if store is not None:
+        store.stop_auto_flush()
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def client():
-    """FastAPI test client."""
-    return TestClient(api_module.app)
+    """FastAPI test client shared by every test in this module.
 
+    Entering the client runs app startup once and keeps one event-loop
+    portal alive for the module; per-test isolation comes from
+    reset_singletons, not from rebuilding the client.
+    """
+    with TestClient(api_module.app) as test_client:
+        yield test_client
 
-@pytest.fixture
-def fake_serial():
-    """Create a FakeSerial instance configured for testing."""
+
+@functools.lru_cache(maxsize=8)
+def _fake_serial_template(serial_number: str, firmware_version: str, quiet_mode: bool):
+    """Build one FakeSerial per configuration; tests reset() it rather than rebuild."""
     return FakeSerial(
-        serial_number="TEST_SENSOR",
-        firmware_version="4.003",
-        quiet_mode=True  # Skip banner for faster tests
+        serial_number=serial_number,
+        firmware_version=firmware_version,
+        quiet_mode=quiet_mode,
     )
 
 
+@pytest.fixture
+def fake_serial():
+    """Provide a FakeSerial configured for testing, reset to power-on state."""
+    fs = _fake_serial_template("TEST_SENSOR", "4.003", True)  # Quiet: skip banner
+    fs.reset()
+    return fs
+
+
 @pytest.fixture
 def monkeypatch_transport(monkeypatch, fake_serial):
     """Monkeypatch Transport.open to use FakeSerial."""
@@ -71,6 +105,54 @@ def monkeypatch_transport(monkeypatch, fake_serial):
     monkeypatch.setattr(Transport, "open", mock_open)
 
 
+@pytest.fixture(scope="module", autouse=True)
+def fast_connect():
+    """Skip the power-on banner settle delay during /connect.
+
+    FakeSerial runs in quiet mode here, so there is no banner to wait out;
+    the fixed DELAY_POST_OPEN sleep was most of every /connect handshake.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(protocol, "DELAY_POST_OPEN", 0.0)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def fast_recorder(monkeypatch):
+    """Cap the recorder poll interval so tests wait on sensor data, not the poll timer.
+
+    The recorder sleeps on an Event with its poll interval rather than
+    time.sleep, so the interval itself is capped at construction.
+    """
+    def make_recorder(controller, store, poll_interval_s=0.2, **kwargs):
+        return DataRecorder(
+            controller, store, poll_interval_s=min(poll_interval_s, 0.01), **kwargs
+        )
+
+    monkeypatch.setattr(api_module, "DataRecorder", make_recorder)
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+async def aclient():
+    """Async client calling the app in-process over ASGI, without a portal thread."""
+    transport = httpx.ASGITransport(app=api_module.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture
+def connected_client(client, monkeypatch_transport):
+    """Test client already connected to the fake sensor."""
+    client.post("/connect?port=/dev/fake&baud=9600")
+    yield client
+
+
 # =============================================================================
 # Health Check
 # =============================================================================
@@ -134,42 +216,67 @@ def test_disconnect_while_recording(client, monkeypatch_transport):
 # Configuration
 # =============================================================================
 
-def test_config_set_averaging(client, monkeypatch_transport):
-    """Test POST /config with averaging parameter."""
-    client.post("/connect?port=/dev/fake&baud=9600")
-
-    response = client.post("/config", json={"averaging": 100})
-    assert response.status_code == 200
-    data = response.json()
-    assert data["averaging"] == 100
+@pytest.mark.parametrize(
+    "payload,expected_status,expected_subset",
+    [
+        ({"averaging": 100}, 200, {"averaging": 100}),
+        ({"adc_rate_hz": 62}, 200, {"adc_rate_hz": 62}),
+        ({"mode": "freerun"}, 200, {"mode": "freerun"}),
+        # FakeSerial rejects averaging < 1 and unsupported rates (InvalidConfigValue)
+        ({"averaging": 0}, 400, None),
+        ({"adc_rate_hz": 999}, 400, None),
+        (
+            {"averaging": 125, "adc_rate_hz": 125, "mode": "freerun"},
+            200,
+            {"averaging": 125, "adc_rate_hz": 125, "mode": "freerun", "sample_period_s": 1.0},
+        ),
+    ],
+    ids=[
+        "averaging",
+        "adc_rate",
+        "mode_freerun",
+        "invalid_averaging",
+        "invalid_rate",
+        "multiple_params",
+    ],
+)
+def test_config(connected_client, payload, expected_status, expected_subset):
+    """Test POST /config applies valid settings and rejects invalid ones."""
+    response = connected_client.post("/config", json=payload)
+    assert response.status_code == expected_status
+
+    if expected_subset is not None:
+        data = response.json()
+        for key, value in expected_subset.items():
+            assert data[key] == value
 
 
-def test_config_set_adc_rate(client, monkeypatch_transport):
-    """Test POST /config with adc_rate_hz parameter."""
-    client.post("/connect?port=/dev/fake&baud=9600")
+def test_config_skips_unchanged_fields(connected_client, monkeypatch):
+    """Test POST /config with the current settings makes no menu round trips."""
+    current = api_module._controller.get_config()
 
-    response = client.post("/config", json={"adc_rate_hz": 62})
-    assert response.status_code == 200
-    data = response.json()
-    assert data["adc_rate_hz"] == 62
+    def unexpected_call(*args, **kwargs):
+        raise AssertionError("unchanged config field was sent to the sensor")
 
+    for name in ("set_averaging", "set_adc_rate", "set_mode"):
+        monkeypatch.setattr(api_module._controller, name, unexpected_call)
 
-def test_config_set_mode_freerun(client, monkeypatch_transport):
-    """Test POST /config to set freerun mode."""
-    client.post("/connect?port=/dev/fake&baud=9600")
+    response = connected_client.post("/config", json={
+        "averaging": current.averaging,
+        "adc_rate_hz": current.adc_rate_hz,
+        "mode": current.mode,
+    })
 
-    response = client.post("/config", json={"mode": "freerun"})
     assert response.status_code == 200
-    data = response.json()
-    assert data["mode"] == "freerun"
+    assert response.json()["averaging"] == current.averaging
 
 
+@pytest.mark.skip(reason="FakeSerial polled mode menu handling needs adjustment")
 def test_config_set_mode_polled(client, monkeypatch_transport):
     """Test POST /config to set polled mode with TAG.
 
     NOTE: Skipped due to FakeSerial menu timing issue with polled mode.
     """
-    pytest.skip("FakeSerial polled mode menu handling needs adjustment")
     client.post("/connect?port=/dev/fake&baud=9600")
 
     response = client.post("/config", json={"mode": "polled", "tag": "B"})
@@ -179,23 +286,6 @@ def test_config_set_mode_polled(client, monkeypatch_transport):
     assert data["tag"] == "B"
 
 
-def test_config_multiple_params(client, monkeypatch_transport):
-    """Test POST /config with multiple parameters."""
-    client.post("/connect?port=/dev/fake&baud=9600")
-
-    response = client.post("/config", json={
-        "averaging": 125,
-        "adc_rate_hz": 125,
-        "mode": "freerun"
-    })
-    assert response.status_code == 200
-    data = response.json()
-    assert data["averaging"] == 125
-    assert data["adc_rate_hz"] == 125
-    assert data["mode"] == "freerun"
-    assert data["sample_period_s"] == 1.0  # 125/125
-
-
 def test_config_not_connected(client):
     """Test POST /config fails when not connected."""
     response = client.post("/config", json={"averaging": 100})
@@ -203,23 +293,6 @@ def test_config_not_connected(client):
     assert "Not connected" in response.json()["detail"]
 
 
-def test_config_invalid_averaging(client, monkeypatch_transport):
-    """Test invalid averaging value returns 400."""
-    client.post("/connect?port=/dev/fake&baud=9600")
-
-    # FakeSerial will reject averaging < 1
-    response = client.post("/config", json={"averaging": 0})
-    assert response.status_code == 400  # InvalidConfigValue
-
-
-def test_config_invalid_rate(client, monkeypatch_transport):
-    """Test invalid ADC rate returns 400."""
-    client.post("/connect?port=/dev/fake&baud=9600")
-
-    response = client.post("/config", json={"adc_rate_hz": 999})
-    assert response.status_code == 400  # InvalidConfigValue
-
-
 # =============================================================================
 # Acquisition & Recording
 # =============================================================================
@@ -270,29 +343,25 @@ def test_recording_start_before_acquisition_fails(client, monkeypatch_transport)
 
 def test_recording_stop_with_csv_flush(client, monkeypatch_transport, tmp_path):
     """Test POST /recording/stop?flush=csv exports data."""
-    import os
-    old_cwd = os.getcwd()
-    os.chdir(tmp_path)
-
-    try:
-        # Start acquisition and recording
-        client.post("/connect?port=/dev/fake&baud=9600")
-        client.post("/config", json={"mode": "freerun", "averaging": 12, "adc_rate_hz": 125})
-        client.post("/start")
-        client.post("/recording/start?poll_interval_s=0.1")
-
-        # Let it record for ~1 second
-        time.sleep(1.0)
-
-        # Stop with flush
-        response = client.post("/recording/stop?flush=csv")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "stopped"
-        assert data["flush_path"] is not None
-        assert Path(data["flush_path"]).exists()
-    finally:
-        os.chdir(old_cwd)
+    # Start acquisition and recording
+    client.post("/connect?port=/dev/fake&baud=9600")
+    client.post("/config", json={"mode": "freerun", "averaging": 12, "adc_rate_hz": 125})
+    client.post("/start")
+    client.post("/recording/start?poll_interval_s=0.01")
+
+    # Wait until at least one row has been recorded
+    assert api_module._store.wait_for_rows(1)
+
+    # Stop with flush into an explicit directory
+    output_dir = tmp_path / "exports"
+    output_dir.mkdir()
+    response = client.post(f"/recording/stop?flush=csv&output_dir={output_dir}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "stopped"
+    assert data["flush_path"] is not None
+    assert Path(data["flush_path"]).exists()
+    assert Path(data["flush_path"]).parent == output_dir
 
 
 def test_recording_stop_without_flush(client, monkeypatch_transport):
@@ -302,8 +371,6 @@ def test_recording_stop_without_flush(client, monkeypatch_transport):
     client.post("/start")
     client.post("/recording/start")
 
-    time.sleep(0.5)
-
     response = client.post("/recording/stop?flush=none")
     assert response.status_code == 200
     data = response.json()
@@ -341,9 +408,10 @@ def test_stop_with_recorder_running(client, monkeypatch_transport):
 # Data Access
 # =============================================================================
 
-def test_status_disconnected(client):
+@pytest.mark.anyio
+async def test_status_disconnected(aclient):
     """Test GET /status when disconnected."""
-    response = client.get("/status")
+    response = await aclient.get("/status")
     assert response.status_code == 200
     data = response.json()
     assert data["connected"] is False
@@ -353,11 +421,12 @@ def test_status_disconnected(client):
     assert data["state"] == "disconnected"
 
 
-def test_status_connected(client, monkeypatch_transport):
+@pytest.mark.anyio
+async def test_status_connected(aclient, monkeypatch_transport):
     """Test GET /status when connected."""
-    client.post("/connect?port=/dev/fake&baud=9600")
+    await aclient.post("/connect?port=/dev/fake&baud=9600")
 
-    response = client.get("/status")
+    response = await aclient.get("/status")
     assert response.status_code == 200
     data = response.json()
     assert data["connected"] is True
@@ -391,25 +460,23 @@ def test_latest_with_data(client, monkeypatch_transport):
     client.post("/connect?port=/dev/fake&baud=9600")
     client.post("/config", json={"mode": "freerun", "averaging": 12, "adc_rate_hz": 125})
     client.post("/start")
-    client.post("/recording/start?poll_interval_s=0.1")
+    client.post("/recording/start?poll_interval_s=0.01")
 
     # Wait for data
-    time.sleep(1.0)
+    assert api_module._store.wait_for_rows(1)
 
     response = client.get("/latest")
     assert response.status_code == 200
     data = response.json()
 
     # Should have schema keys
-    assert "timestamp" in data
-    assert "sensor_id" in data
-    assert "mode" in data
-    assert "value" in data
+    assert EXPECTED_ROW_KEYS <= data.keys()
 
 
-def test_recent_no_data(client):
+@pytest.mark.anyio
+async def test_recent_no_data(aclient):
     """Test GET /recent returns empty rows when no data."""
-    response = client.get("/recent?seconds=60")
+    response = await aclient.get("/recent?seconds=60")
     assert response.status_code == 200
     data = response.json()
     assert data["rows"] == []
@@ -420,10 +487,10 @@ def test_recent_with_data(client, monkeypatch_transport):
     client.post("/connect?port=/dev/fake&baud=9600")
     client.post("/config", json={"mode": "freerun", "averaging": 12, "adc_rate_hz": 125})
     client.post("/start")
-    client.post("/recording/start?poll_interval_s=0.1")
+    client.post("/recording/start?poll_interval_s=0.01")
 
     # Wait for data (~10 Hz expected)
-    time.sleep(1.5)
+    assert api_module._store.wait_for_rows(5)
 
     response = client.get("/recent?seconds=2")
     assert response.status_code == 200
@@ -433,26 +500,25 @@ def test_recent_with_data(client, monkeypatch_transport):
     assert len(data["rows"]) > 0
 
     # Check first row has schema keys
-    row = data["rows"][0]
-    assert "timestamp" in row
-    assert "value" in row
-    assert "mode" in row
+    assert EXPECTED_RECENT_KEYS <= data["rows"][0].keys()
 
 
-def test_recent_capped_at_300s(client):
+@pytest.mark.anyio
+async def test_recent_capped_at_300s(aclient):
     """Test GET /recent rejects >300 seconds."""
     # Request 9999 seconds, FastAPI validation should reject (le=300)
-    response = client.get("/recent?seconds=9999")
+    response = await aclient.get("/recent?seconds=9999")
     assert response.status_code == 422  # Validation error
 
     # But 300 should work
-    response = client.get("/recent?seconds=300")
+    response = await aclient.get("/recent?seconds=300")
     assert response.status_code == 200
 
 
-def test_recent_min_1s(client):
+@pytest.mark.anyio
+async def test_recent_min_1s(aclient):
     """Test GET /recent enforces minimum of 1 second."""
-    response = client.get("/recent?seconds=0")
+    response = await aclient.get("/recent?seconds=0")
     assert response.status_code == 422  # Validation error from FastAPI
 
 
@@ -460,14 +526,15 @@ def test_recent_min_1s(client):
 # Full Workflow: Freerun
 # =============================================================================
 
-def test_full_workflow_freerun(client, monkeypatch_transport):
+@pytest.mark.anyio
+async def test_full_workflow_freerun(aclient, monkeypatch_transport):
     """End-to-end test: connect, config, start, record, data access, stop."""
     # 1. Connect
-    response = client.post("/connect?port=/dev/fake&baud=9600")
+    response = await aclient.post("/connect?port=/dev/fake&baud=9600")
     assert response.status_code == 200
 
     # 2. Configure for freerun
-    response = client.post("/config", json={
+    response = await aclient.post("/config", json={
         "averaging": 12,
         "adc_rate_hz": 125,
         "mode": "freerun"
@@ -476,40 +543,40 @@ def test_full_workflow_freerun(client, monkeypatch_transport):
     assert response.json()["sample_period_s"] == pytest.approx(0.096, abs=0.01)
 
     # 3. Start acquisition
-    response = client.post("/start")
+    response = await aclient.post("/start")
     assert response.status_code == 200
 
     # 4. Start recording
-    response = client.post("/recording/start?poll_interval_s=0.1")
+    response = await aclient.post("/recording/start?poll_interval_s=0.01")
     assert response.status_code == 200
 
     # 5. Wait for data (~10 Hz)
-    time.sleep(1.5)
+    assert await asyncio.to_thread(api_module._store.wait_for_rows, 6)
 
-    # 6. Check status
-    status = client.get("/status").json()
+    # 6-8. Status, latest and recent are read-only, so fetch them together
+    status, latest, recent = await asyncio.gather(
+        aclient.get("/status"), aclient.get("/latest"), aclient.get("/recent?seconds=2")
+    )
+
+    status = status.json()
     assert status["connected"] is True
     assert status["recording"] is True
     assert status["rows"] > 5  # Should have collected data
 
-    # 7. Get latest
-    latest = client.get("/latest").json()
-    assert "value" in latest
+    assert "value" in latest.json()
 
-    # 8. Get recent
-    recent = client.get("/recent?seconds=2").json()
-    assert len(recent["rows"]) >= 5
+    assert len(recent.json()["rows"]) >= 5
 
     # 9. Stop recording (BEFORE controller)
-    response = client.post("/recording/stop?flush=none")
+    response = await aclient.post("/recording/stop?flush=none")
     assert response.status_code == 200
 
     # 10. Stop acquisition
-    response = client.post("/stop")
+    response = await aclient.post("/stop")
     assert response.status_code == 200
 
     # 11. Disconnect
-    response = client.post("/disconnect")
+    response = await aclient.post("/disconnect")
     assert response.status_code == 200
 
 
@@ -517,12 +584,12 @@ def test_full_workflow_freerun(client, monkeypatch_transport):
 # Full Workflow: Polled
 # =============================================================================
 
+@pytest.mark.skip(reason="FakeSerial polled mode menu handling needs adjustment")
 def test_full_workflow_polled(client, monkeypatch_transport):
     """End-to-end test: polled mode with poll_hz=2.0.
 
     NOTE: Skipped due to FakeSerial menu timing issue with polled mode config.
     """
-    pytest.skip("FakeSerial polled mode menu handling needs adjustment")
     # 1. Connect
     client.post("/connect?port=/dev/fake&baud=9600")
 
@@ -543,7 +610,7 @@ def test_full_workflow_polled(client, monkeypatch_transport):
     client.post("/recording/start?poll_interval_s=0.1")
 
     # 5. Wait for ~3 readings (1.5s at 2 Hz)
-    time.sleep(1.8)
+    assert api_module._store.wait_for_rows(3)
 
     # 6. Get recent
     recent = client.get("/recent?seconds=2").json()
@@ -566,16 +633,23 @@ def test_full_workflow_polled(client, monkeypatch_transport):
 # Error Mapping
 # =============================================================================
 
-def test_error_menu_timeout_504(client, monkeypatch_transport, monkeypatch):
-    """Test MenuTimeout exception maps to 504."""
-    from q_sensor_lib.errors import MenuTimeout
+def _mock_set_averaging_timeout(self, n):
+    raise MenuTimeout("Simulated timeout")
+
 
-    # Monkeypatch set_averaging to raise MenuTimeout
-    original_set_averaging = api_module.SensorController.set_averaging
-    def mock_set_averaging(self, n):
-        raise MenuTimeout("Simulated timeout")
+def _mock_set_adc_rate_invalid(self, rate):
+    raise InvalidConfigValue("Invalid rate")
 
-    monkeypatch.setattr(api_module.SensorController, "set_averaging", mock_set_averaging)
+
+def _mock_start_acquisition_serial_io(self, poll_hz=1.0):
+    raise SerialIOError("Serial port error")
+
+
+def test_error_menu_timeout_504(client, monkeypatch_transport, monkeypatch):
+    """Test MenuTimeout exception maps to 504."""
+    monkeypatch.setattr(
+        api_module.SensorController, "set_averaging", _mock_set_averaging_timeout
+    )
 
     client.post("/connect?port=/dev/fake&baud=9600")
     response = client.post("/config", json={"averaging": 100})
@@ -583,41 +657,26 @@ def test_error_menu_timeout_504(client, monkeypatch_transport, monkeypatch):
     assert response.status_code == 504
     assert "timeout" in response.json()["detail"].lower()
 
-    # Restore
-    monkeypatch.setattr(api_module.SensorController, "set_averaging", original_set_averaging)
-
 
 def test_error_invalid_config_400(client, monkeypatch_transport, monkeypatch):
     """Test InvalidConfigValue exception maps to 400."""
-    from q_sensor_lib.errors import InvalidConfigValue
-
-    # Monkeypatch set_adc_rate to raise InvalidConfigValue
-    original_set_adc_rate = api_module.SensorController.set_adc_rate
-    def mock_set_adc_rate(self, rate):
-        raise InvalidConfigValue("Invalid rate")
-
-    monkeypatch.setattr(api_module.SensorController, "set_adc_rate", mock_set_adc_rate)
+    monkeypatch.setattr(
+        api_module.SensorController, "set_adc_rate", _mock_set_adc_rate_invalid
+    )
 
     client.post("/connect?port=/dev/fake&baud=9600")
-    response = client.post("/config", json={"adc_rate_hz": 999})
+    # A supported rate passes set_config's own validation and reaches the mock
+    response = client.post("/config", json={"adc_rate_hz": 62})
 
     assert response.status_code == 400
     assert "Invalid" in response.json()["detail"]
 
-    # Restore
-    monkeypatch.setattr(api_module.SensorController, "set_adc_rate", original_set_adc_rate)
-
 
 def test_error_serial_io_503(client, monkeypatch_transport, monkeypatch):
     """Test SerialIOError exception maps to 503."""
-    from q_sensor_lib.errors import SerialIOError
-
-    # Monkeypatch start_acquisition to raise SerialIOError
-    original_start = api_module.SensorController.start_acquisition
-    def mock_start(self, poll_hz=1.0):
-        raise SerialIOError("Serial port error")
-
-    monkeypatch.setattr(api_module.SensorController, "start_acquisition", mock_start)
+    monkeypatch.setattr(
+        api_module.SensorController, "start_acquisition", _mock_start_acquisition_serial_io
+    )
 
     client.post("/connect?port=/dev/fake&baud=9600")
     response = client.post("/start")
@@ -625,9 +684,6 @@ def test_error_serial_io_503(client, monkeypatch_transport, monkeypatch):
     assert response.status_code == 503
     assert "Serial" in response.json()["detail"]
 
-    # Restore
-    monkeypatch.setattr(api_module.SensorController, "start_acquisition", original_start)
-
 
 # =============================================================================
 # New Endpoint Tests
@@ -657,8 +713,6 @@ def test_stats_endpoint_with_alias(client):
 
 def test_stats_endpoint_with_data(client, monkeypatch_transport):
     """Test GET /stats with actual data."""
-    import time
-
     # Connect and start freerun
     client.post("/connect?port=/dev/fake&baud=9600")
     client.post("/config", json={"mode": "freerun", "averaging": 1})
@@ -668,7 +722,7 @@ def test_stats_endpoint_with_data(client, monkeypatch_transport):
     client.post("/recording/start?poll_interval_s=0.1")
 
     # Wait for some data
-    time.sleep(0.5)
+    assert api_module._store.wait_for_rows(1)
 
     # Get stats
     response = client.get("/stats")
@@ -753,8 +807,6 @@ def test_resume_not_paused(client, monkeypatch_transport):
 
 def test_export_csv_endpoint(client, monkeypatch_transport):
     """Test GET /export/csv endpoint."""
-    import time
-
     # Connect and start
     client.post("/connect?port=/dev/fake&baud=9600")
     client.post("/config", json={"mode": "freerun", "averaging": 1})
@@ -762,7 +814,7 @@ def test_export_csv_endpoint(client, monkeypatch_transport):
     client.post("/recording/start?poll_interval_s=0.1")
 
     # Wait for data
-    time.sleep(0.3)
+    assert api_module._store.wait_for_rows(1)
 
     # Export CSV
     response = client.get("/export/csv")
@@ -778,8 +830,6 @@ def test_export_csv_endpoint(client, monkeypatch_transport):
 
 def test_export_csv_via_alias(client, monkeypatch_transport):
     """Test GET /recording/export/csv alias."""
-    import time
-
     # Connect and start
     client.post("/connect?port=/dev/fake&baud=9600")
     client.post("/config", json={"mode": "freerun", "averaging": 1})
@@ -787,7 +837,7 @@ def test_export_csv_via_alias(client, monkeypatch_transport):
     client.post("/recording/start?poll_interval_s=0.1")
 
     # Wait for data
-    time.sleep(0.3)
+    assert api_module._store.wait_for_rows(1)
 
     # Export via alias
     response = client.get("/recording/export/csv")
@@ -810,8 +860,6 @@ def test_export_csv_no_data(client):
 
 def test_export_parquet_endpoint(client, monkeypatch_transport):
     """Test GET /export/parquet endpoint."""
-    import time
-
     # Connect and start
     client.post("/connect?port=/dev/fake&baud=9600")
     client.post("/config", json={"mode": "freerun", "averaging": 1})
@@ -819,7 +867,7 @@ def test_export_parquet_endpoint(client, monkeypatch_transport):
     client.post("/recording/start?poll_interval_s=0.1")
 
     # Wait for data
-    time.sleep(0.3)
+    assert api_module._store.wait_for_rows(1)
 
     # Export Parquet
     response = client.get("/export/parquet")
@@ -835,8 +883,6 @@ def test_export_parquet_endpoint(client, monkeypatch_transport):
 
 def test_export_parquet_via_alias(client, monkeypatch_transport):
     """Test GET /recording/export/parquet alias."""
-    import time
-
     # Connect and start
     client.post("/connect?port=/dev/fake&baud=9600")
     client.post("/config", json={"mode": "freerun", "averaging": 1})
@@ -844,7 +890,7 @@ def test_export_parquet_via_alias(client, monkeypatch_transport):
     client.post("/recording/start?poll_interval_s=0.1")
 
     # Wait for data
-    time.sleep(0.3)
+    assert api_module._store.wait_for_rows(1)
 
     # Export via alias
     response = client.get("/recording/export/parquet")
@@ -858,8 +904,6 @@ def test_export_parquet_via_alias(client, monkeypatch_transport):
 
 def test_recording_stop_with_parquet_flush(client, monkeypatch_transport):
     """Test recording stop with Parquet flush format."""
-    import time
-
     # Connect and start
     client.post("/connect?port=/dev/fake&baud=9600")
     client.post("/config", json={"mode": "freerun", "averaging": 1})
@@ -867,7 +911,7 @@ def test_recording_stop_with_parquet_flush(client, monkeypatch_transport):
     client.post("/recording/start?poll_interval_s=0.1")
 
     # Wait for data
-    time.sleep(0.3)
+    assert api_module._store.wait_for_rows(1)
 
     # Stop with parquet flush
     response = client.post("/recording/stop?flush=parquet")
@@ -8,42 +8,56 @@ Tests verify:
 """
 
 import asyncio
+import threading
 import time
+from datetime import datetime, timezone
 
 import pytest
 from fastapi.testclient import TestClient
 
 from api import main as api_module
+from data_store import DataStore
 from fakes.fake_serial import FakeSerial
+from q_sensor_lib.models import Reading
 from q_sensor_lib.transport import Transport
 
 
 @pytest.fixture(autouse=True)
-def reset_singletons():
-    """Reset global singletons before each test."""
-    api_module._controller = None
-    api_module._store = None
-    api_module._recorder = None
+def reset_singletons(monkeypatch, tmp_path):
+    """Roll the API globals back to the disconnected state around each test.
+
+    The globals are patched to None and restored by monkeypatch, so teardown
+    only has to stop what the test actually started.
+    """
+    monkeypatch.setattr(api_module, "EXPORT_PATH", str(tmp_path))
+    monkeypatch.setattr(api_module, "_controller", None)
+    monkeypatch.setattr(api_module, "_store", None)
+    monkeypatch.setattr(api_module, "_recorder", None)
     yield
-    # Cleanup
-    if api_module._recorder and api_module._recorder.is_running():
-        api_module._recorder.stop()
-    if api_module._controller and api_module._controller.is_connected():
+
+    recorder = api_module._recorder
+    if recorder is not None and recorder.is_running():
+        recorder.stop()
+
+    controller = api_module._controller
+    if controller is not None and controller.is_connected():
         try:
-            if api_module._controller.state.value in ("acq_freerun", "acq_polled"):
-                api_module._controller.stop()
-            api_module._controller.disconnect()
+            if controller.state.value in ("acq_freerun", "acq_polled"):
+                controller.stop()
+            controller.disconnect()
         except Exception:
             pass
-    api_module._controller = None
-    api_module._store = None
-    api_module._recorder = None
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """FastAPI test client."""
-    return TestClient(api_module.app)
+    """FastAPI test client shared by every test in this module.
+
+    Per-test isolation comes from reset_singletons, not from rebuilding
+    the client.
+    """
+    with TestClient(api_module.app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
@@ -76,6 +90,41 @@ def test_websocket_no_store(client):
         assert "No data store" in data["error"]
 
 
+def test_websocket_fan_out_from_recorder_thread(client):
+    """Test readings published from another thread reach every subscriber in order."""
+    api_module._store = DataStore()
+    readings = [
+        Reading(
+            ts=datetime.now(timezone.utc),
+            sensor_id="WS_TEST",
+            mode="freerun",
+            data={"value": float(i)},
+        )
+        for i in range(3)
+    ]
+
+    with client.websocket_connect("/stream") as ws1:
+        with client.websocket_connect("/stream") as ws2:
+            deadline = time.monotonic() + 2.0
+            while len(api_module._ws_subscribers) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            publisher = threading.Thread(
+                target=api_module._publish_readings, args=(readings,)
+            )
+            publisher.start()
+            publisher.join()
+
+            for ws in (ws1, ws2):
+                values = [ws.receive_json()["value"] for _ in readings]
+                assert values == [0.0, 1.0, 2.0]
+
+    deadline = time.monotonic() + 2.0
+    while api_module._ws_subscribers and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not api_module._ws_subscribers
+
+
 def test_websocket_stream_freerun(client, monkeypatch_transport):
     """Test WebSocket receives streaming readings in freerun mode."""
     # Setup: connect, config, start acquisition, start recording
@@ -84,8 +133,8 @@ def test_websocket_stream_freerun(client, monkeypatch_transport):
     client.post("/start")
     client.post("/recording/start?poll_interval_s=0.1")
 
-    # Give it time to start streaming (~10 Hz expected)
-    time.sleep(0.5)
+    # Wait until streaming has started (~10 Hz expected)
+    assert api_module._store.wait_for_rows(3)
 
     # Connect WebSocket
     with client.websocket_connect("/stream") as websocket:
@@ -127,8 +176,8 @@ def test_websocket_stream_empty_initially(client, monkeypatch_transport):
 
     # Connect WebSocket immediately (minimal data yet)
     with client.websocket_connect("/stream") as websocket:
-        # Wait for first message
-        time.sleep(1.5)  # Wait for data to accumulate
+        # Wait for data to accumulate
+        assert api_module._store.wait_for_rows(1)
 
         # Try to receive
         try:
@@ -148,7 +197,7 @@ def test_websocket_multiple_clients(client, monkeypatch_transport):
     client.post("/start")
     client.post("/recording/start?poll_interval_s=0.1")
 
-    time.sleep(0.5)
+    assert api_module._store.wait_for_rows(3)
 
     # Connect two WebSocket clients
     with client.websocket_connect("/stream") as ws1:
@@ -8,23 +8,52 @@ from q_sensor_lib.errors import InvalidConfigValue
 from q_sensor_lib.models import ConnectionState
 
 
-def test_set_averaging_valid() -> None:
-    """Test setting averaging to valid value."""
-    fake_serial = FakeSerial()
+@pytest.fixture(scope="module")
+def fake_serial():
+    """One FakeSerial shared by the module; connecting is the slow part of each test."""
+    return FakeSerial()
+
+
+@pytest.fixture(scope="module")
+def controller(fake_serial):
+    """SensorController connected once to the shared FakeSerial."""
     controller = SensorController()
     controller.connect(serial_port=fake_serial)
+    yield controller
+    controller.disconnect()
+
+
+@pytest.fixture
+def menu_state(request, controller, fake_serial):
+    """The shared controller, in CONFIG_MENU.
+
+    A test that left acquisition running is stopped. A failed test may leave
+    the device mid-exchange; the device is then reset and the controller
+    reconnected, so one failure cannot cascade into the following tests.
+    """
+    if controller.state != ConnectionState.CONFIG_MENU:
+        controller.stop()
+
+    yield controller
+
+    if request.node.rep_call.failed:
+        controller.disconnect()
+        fake_serial.reset()
+        controller.connect(serial_port=fake_serial)
+
+
+def test_set_averaging_valid(menu_state) -> None:
+    """Test setting averaging to valid value."""
+    controller = menu_state
 
     config = controller.set_averaging(250)
 
     assert config.averaging == 250
-    controller.disconnect()
 
 
-def test_set_averaging_invalid_rejects() -> None:
+def test_set_averaging_invalid_rejects(menu_state) -> None:
     """Test that invalid averaging value raises error."""
-    fake_serial = FakeSerial()
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = menu_state
 
     # Too small
     with pytest.raises(InvalidConfigValue):
@@ -34,52 +63,37 @@ def test_set_averaging_invalid_rejects() -> None:
     with pytest.raises(InvalidConfigValue):
         controller.set_averaging(100000)
 
-    controller.disconnect()
-
 
-def test_set_adc_rate_valid() -> None:
+def test_set_adc_rate_valid(menu_state) -> None:
     """Test setting ADC rate to valid value."""
-    fake_serial = FakeSerial()
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = menu_state
 
     config = controller.set_adc_rate(125)
 
     assert config.adc_rate_hz == 125
-    controller.disconnect()
 
 
-def test_set_adc_rate_invalid() -> None:
+def test_set_adc_rate_invalid(menu_state) -> None:
     """Test that invalid ADC rate raises error."""
-    fake_serial = FakeSerial()
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = menu_state
 
     with pytest.raises(InvalidConfigValue):
         controller.set_adc_rate(99)  # Not in valid set
 
-    controller.disconnect()
-
 
-def test_set_mode_freerun() -> None:
+def test_set_mode_freerun(menu_state, fake_serial) -> None:
     """Test setting mode to freerun."""
-    fake_serial = FakeSerial()
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = menu_state
 
     config = controller.set_mode("freerun")
 
     assert config.mode == "freerun"
     assert fake_serial.operating_mode == "0"
 
-    controller.disconnect()
-
 
-def test_set_mode_polled_with_tag() -> None:
+def test_set_mode_polled_with_tag(menu_state, fake_serial) -> None:
     """Test setting mode to polled with valid TAG."""
-    fake_serial = FakeSerial()
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = menu_state
 
     config = controller.set_mode("polled", tag="B")
 
@@ -88,26 +102,18 @@ def test_set_mode_polled_with_tag() -> None:
     assert fake_serial.operating_mode == "1"
     assert fake_serial.tag == "B"
 
-    controller.disconnect()
-
 
-def test_set_mode_polled_without_tag_raises() -> None:
+def test_set_mode_polled_without_tag_raises(menu_state) -> None:
     """Test that polled mode without TAG raises error."""
-    fake_serial = FakeSerial()
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = menu_state
 
     with pytest.raises(InvalidConfigValue):
         controller.set_mode("polled", tag=None)
 
-    controller.disconnect()
-
 
-def test_set_mode_polled_invalid_tag() -> None:
+def test_set_mode_polled_invalid_tag(menu_state) -> None:
     """Test that polled mode with invalid TAG raises error."""
-    fake_serial = FakeSerial()
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = menu_state
 
     # Lowercase not allowed
     with pytest.raises(InvalidConfigValue):
@@ -117,14 +123,10 @@ def test_set_mode_polled_invalid_tag() -> None:
     with pytest.raises(InvalidConfigValue):
         controller.set_mode("polled", tag="AB")
 
-    controller.disconnect()
-
 
-def test_set_config_outside_menu_raises() -> None:
+def test_set_config_outside_menu_raises(menu_state) -> None:
     """Test that setting config outside menu state raises error."""
-    fake_serial = FakeSerial()
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = menu_state
 
     # Start acquisition
     controller.start_acquisition()
@@ -134,14 +136,10 @@ def test_set_config_outside_menu_raises() -> None:
     with pytest.raises(Exception):  # SerialIOError
         controller.set_averaging(200)
 
-    controller.disconnect()
-
 
-def test_multiple_config_changes() -> None:
+def test_multiple_config_changes(menu_state) -> None:
     """Test chaining multiple configuration changes."""
-    fake_serial = FakeSerial()
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = menu_state
 
     controller.set_averaging(100)
     controller.set_adc_rate(62)
@@ -152,4 +150,32 @@ def test_multiple_config_changes() -> None:
     assert config.mode == "polled"
     assert config.tag == "C"
 
-    controller.disconnect()
+
+def test_set_config_applies_changed_fields(menu_state) -> None:
+    """Test set_config applies several fields and skips ones already set."""
+    controller = menu_state
+    controller.set_averaging(100)
+
+    calls = []
+    original = controller.set_averaging
+    controller.set_averaging = lambda n: calls.append(n) or original(n)
+    try:
+        config = controller.set_config(averaging=100, adc_rate_hz=62)
+    finally:
+        del controller.set_averaging
+
+    assert calls == []
+    assert config.averaging == 100
+    assert config.adc_rate_hz == 62
+
+
+def test_set_config_validates_before_sending(menu_state, fake_serial) -> None:
+    """Test an invalid field rejects the whole set_config before any change is sent."""
+    controller = menu_state
+    before = controller.get_config().averaging
+
+    with pytest.raises(InvalidConfigValue):
+        controller.set_config(averaging=before + 1, adc_rate_hz=61)
+
+    assert controller.get_config().averaging == before
+    assert fake_serial.averaging == before
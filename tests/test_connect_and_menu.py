@@ -80,3 +80,22 @@ def test_disconnect_from_menu() -> None:
     controller.disconnect()
     assert controller.state == ConnectionState.DISCONNECTED
     assert not fake_serial.is_open
+
+
+def test_fake_serial_reset_restores_power_on_state() -> None:
+    """Test that FakeSerial.reset() lets one instance serve a fresh connection."""
+    fake_serial = FakeSerial(serial_number="TEST123", quiet_mode=True)
+    controller = SensorController()
+    controller.connect(serial_port=fake_serial)
+    controller.set_averaging(50)
+    controller.disconnect()
+    assert not fake_serial.is_open
+
+    fake_serial.reset()
+    assert fake_serial.is_open
+    assert fake_serial.in_waiting == 0
+
+    controller = SensorController()
+    controller.connect(serial_port=fake_serial)
+    assert controller.get_config().averaging == 125
+    controller.disconnect()
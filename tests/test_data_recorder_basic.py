@@ -12,7 +12,7 @@ Tests verify:
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from threading import Thread
+from threading import Event, Thread
 from typing import List
 
 import pandas as pd
@@ -42,7 +42,7 @@ class FakeController:
         self.include_vin = include_vin
         self._buffer: List[Reading] = []
         self._next_value = 100.0
-        self._generating = False
+        self._gen_stop = Event()
         self._gen_thread = None
 
     def read_buffer_snapshot(self) -> List[Reading]:
@@ -57,16 +57,16 @@ class FakeController:
         Args:
             rate_hz: Generation rate in Hz (default 15 Hz, typical for 125/125 config)
         """
-        if self._generating:
+        if self._gen_thread:
             return
 
-        self._generating = True
+        self._gen_stop.clear()
         self._gen_thread = Thread(target=self._generation_loop, args=(rate_hz,), daemon=True)
         self._gen_thread.start()
 
     def stop_generating(self) -> None:
         """Stop background generation thread."""
-        self._generating = False
+        self._gen_stop.set()
         if self._gen_thread:
             self._gen_thread.join(timeout=2.0)
             self._gen_thread = None
@@ -92,13 +92,55 @@ class FakeController:
         self._buffer.clear()
 
     def _generation_loop(self, rate_hz: float) -> None:
-        """Background thread that generates readings at specified rate."""
+        """Background thread that generates readings at specified rate.
+
+        Readings are scheduled against absolute deadlines so the rate does not
+        drift, and waiting on an Event lets stop_generating() return at once.
+        """
         period = 1.0 / rate_hz
-        while self._generating:
+        next_at = time.monotonic()
+        while True:
             ts = datetime.now(timezone.utc)
             self.add_reading(ts, self._next_value)
             self._next_value += 0.1
-            time.sleep(period)
+            next_at += period
+            if self._gen_stop.wait(max(next_at - time.monotonic(), 0.0)):
+                return
+
+
+@pytest.fixture(scope="module")
+def sample_readings() -> List[Reading]:
+    """Five freerun readings one second apart with values 0.0..4.0.
+
+    Module-scoped and shared: tests must not modify the list or its readings.
+    """
+    return [
+        Reading(
+            ts=datetime(2025, 1, 15, 12, 0, i, tzinfo=timezone.utc),
+            sensor_id="Q12345",
+            mode="freerun",
+            data={"value": float(i)},
+        )
+        for i in range(5)
+    ]
+
+
+@pytest.fixture
+def make_arrays():
+    """Factory for bulk column input: n timestamps period_s apart, and values 0..n-1.
+
+    Built with numpy in one shot, for DataStore.append_arrays() and stress
+    tests too large to construct as Reading objects.
+    """
+    import numpy as np
+
+    def make(n: int, period_s: float = 0.1, start: int = 0):
+        period_us = np.timedelta64(round(period_s * 1e6), "us")
+        offsets = np.arange(start, start + n)
+        timestamps = np.datetime64("2025-01-15T12:00:00", "us") + offsets * period_us
+        return timestamps, offsets.astype("f8")
+
+    return make
 
 
 # =============================================================================
@@ -198,25 +240,15 @@ def test_datastore_init_empty():
     assert list(df.columns) == list(SCHEMA.keys())
 
 
-def test_datastore_append_single_batch():
+def test_datastore_append_single_batch(sample_readings):
     """Test appending a batch of readings."""
     store = DataStore()
 
-    readings = [
-        Reading(
-            ts=datetime(2025, 1, 15, 12, 0, i, tzinfo=timezone.utc),
-            sensor_id="Q12345",
-            mode="freerun",
-            data={"value": 100.0 + i},
-        )
-        for i in range(5)
-    ]
-
-    store.append_readings(readings)
+    store.append_readings(sample_readings)
     df = store.get_dataframe()
 
     assert len(df) == 5
-    assert df["value"].tolist() == [100.0, 101.0, 102.0, 103.0, 104.0]
+    assert df["value"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
     assert df["sensor_id"].iloc[0] == "Q12345"
 
 
@@ -240,6 +272,24 @@ def test_datastore_append_handles_nan():
     assert pd.isna(df["Vin"].iloc[0])
 
 
+def test_datastore_normalizes_timestamps_to_utc():
+    """Test naive timestamps are stored as UTC and offset timestamps are converted."""
+    store = DataStore()
+    plus_two = timezone(timedelta(hours=2))
+
+    store.append_readings([
+        Reading(ts=datetime(2025, 1, 15, 12, 0, 0), sensor_id="Q12345", mode="freerun",
+                data={"value": 1.0}),
+        Reading(ts=datetime(2025, 1, 15, 14, 0, 1, 500000, tzinfo=plus_two),
+                sensor_id="Q12345", mode="freerun", data={"value": 2.0}),
+    ])
+
+    assert store.get_dataframe()["timestamp"].tolist() == [
+        "2025-01-15T12:00:00+00:00",
+        "2025-01-15T12:00:01.500000+00:00",
+    ]
+
+
 def test_datastore_max_rows_trimming():
     """Test that DataStore trims to max_rows, keeping most recent."""
     store = DataStore(max_rows=10)
@@ -264,6 +314,56 @@ def test_datastore_max_rows_trimming():
     assert df["value"].iloc[-1] == 14.0  # Newest
 
 
+def test_datastore_grows_and_trims_across_reallocation():
+    """Test rows stay ordered while capacity grows and old rows are compacted away."""
+    store = DataStore(max_rows=1500)
+    base_ts = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+    for start in range(0, 5000, 7):
+        store.append_readings([
+            Reading(
+                ts=base_ts + timedelta(milliseconds=i),
+                sensor_id="Q12345",
+                mode="freerun",
+                data={"value": float(i)},
+            )
+            for i in range(start, min(start + 7, 5000))
+        ])
+
+    df = store.get_dataframe()
+    assert len(df) == 1500
+    assert df["value"].tolist() == [float(i) for i in range(3500, 5000)]
+    assert store.get_latest()["value"] == 4999.0
+
+
+def test_datastore_get_dataframe_reuses_frame_until_append():
+    """Test repeated get_dataframe() calls share one build but return independent copies."""
+    import numpy as np
+
+    store = DataStore()
+    base_ts = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+    def reading(i):
+        return Reading(ts=base_ts + timedelta(seconds=i), sensor_id="Q12345",
+                       mode="freerun", data={"value": float(i)})
+
+    store.append_readings([reading(0), reading(1)])
+    first = store.get_dataframe()
+    first.loc[0, "value"] = -1.0
+
+    assert store.get_dataframe()["value"].tolist() == [0.0, 1.0]
+    assert store._frame() is store._frame()
+
+    # The cached frame views the store arrays; get_recent() hands out a copy
+    assert np.shares_memory(store._frame()["value"].to_numpy(), store._cols["value"])
+    recent = store.get_recent(seconds=10**9)
+    recent.loc[0, "value"] = -1.0
+    assert store.get_dataframe()["value"].tolist() == [0.0, 1.0]
+
+    store.append_readings([reading(2)])
+    assert store.get_dataframe()["value"].tolist() == [0.0, 1.0, 2.0]
+
+
 def test_datastore_get_recent():
     """Test get_recent() filters by time window."""
     store = DataStore()
@@ -300,25 +400,15 @@ def test_datastore_get_recent():
     assert recent["value"].tolist() == [2.0, 3.0]
 
 
-def test_datastore_get_latest():
+def test_datastore_get_latest(sample_readings):
     """Test get_latest() returns most recent reading."""
     store = DataStore()
 
-    readings = [
-        Reading(
-            ts=datetime(2025, 1, 15, 12, 0, i, tzinfo=timezone.utc),
-            sensor_id="Q12345",
-            mode="freerun",
-            data={"value": float(i)},
-        )
-        for i in range(3)
-    ]
-
-    store.append_readings(readings)
+    store.append_readings(sample_readings)
 
     latest = store.get_latest()
     assert latest is not None
-    assert latest["value"] == 2.0
+    assert latest["value"] == 4.0
     assert latest["sensor_id"] == "Q12345"
 
 
@@ -354,21 +444,38 @@ def test_datastore_get_stats():
     assert stats["est_sample_rate_hz"] == pytest.approx(10.0, abs=0.1)
 
 
-def test_datastore_export_csv(tmp_path):
+def test_datastore_get_stats_after_trim():
+    """Test get_stats() start/end follow the rows kept after max_rows trimming."""
+    store = DataStore(max_rows=5)
+
+    base_ts = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+    for batch in range(3):
+        store.append_readings([
+            Reading(
+                ts=base_ts + timedelta(seconds=batch * 4 + i),
+                sensor_id="Q12345",
+                mode="freerun",
+                data={"value": float(i)},
+            )
+            for i in range(4)
+        ])
+
+    stats = store.get_stats()
+
+    assert stats["row_count"] == 5
+    assert stats["start_time"] == "2025-01-15T12:00:07+00:00"
+    assert stats["end_time"] == "2025-01-15T12:00:11+00:00"
+    assert stats["duration_s"] == 4.0
+
+    store.clear()
+    assert store.get_stats()["row_count"] == 0
+
+
+def test_datastore_export_csv(tmp_path, sample_readings):
     """Test CSV export functionality."""
     store = DataStore()
 
-    readings = [
-        Reading(
-            ts=datetime(2025, 1, 15, 12, 0, i, tzinfo=timezone.utc),
-            sensor_id="Q12345",
-            mode="freerun",
-            data={"value": float(i)},
-        )
-        for i in range(5)
-    ]
-
-    store.append_readings(readings)
+    store.append_readings(sample_readings)
 
     # Export to temp directory
     csv_path = tmp_path / "test_export.csv"
@@ -381,6 +488,158 @@ def test_datastore_export_csv(tmp_path):
     assert "value" in df_loaded.columns
 
 
+def test_datastore_export_csv_chunked_matches_single_write(tmp_path):
+    """Test that a windowed CSV export is identical to writing the whole frame."""
+    store = DataStore()
+
+    store.append_readings(
+        [
+            Reading(
+                ts=datetime(2025, 1, 15, 12, 0, i, tzinfo=timezone.utc),
+                sensor_id="Q12345",
+                mode="freerun",
+                data={"value": float(i), "TempC": 21.5} if i % 2 else {"value": float(i)},
+            )
+            for i in range(10)
+        ]
+    )
+
+    chunked = Path(store.export_csv(str(tmp_path / "chunked.csv"), chunk=3))
+    whole = tmp_path / "whole.csv"
+    store.get_dataframe().to_csv(whole, index=False)
+
+    assert chunked.read_bytes() == whole.read_bytes()
+
+    # An empty store still gets a header row
+    store.clear()
+    empty = Path(store.export_csv(str(tmp_path / "empty.csv"), chunk=3))
+    assert empty.read_text().strip() == ",".join(SCHEMA.keys())
+
+
+def test_datastore_append_arrays_matches_append_readings(make_arrays):
+    """Test the array fast path stores the same rows as append_readings()."""
+    import numpy as np
+
+    start = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+    readings = [
+        Reading(
+            ts=start + timedelta(milliseconds=100 * i),
+            sensor_id="Q12345",
+            mode="freerun",
+            data={"value": float(i), "TempC": 21.5} if i % 2 else {"value": float(i)},
+        )
+        for i in range(6)
+    ]
+    from_readings = DataStore(max_rows=4)
+    from_readings.append_readings(readings)
+
+    from_arrays = DataStore(max_rows=4)
+    from_arrays.append_arrays(
+        *make_arrays(6, period_s=0.1),
+        sensor_id="Q12345",
+        mode="freerun",
+        temp_c=np.where(np.arange(6) % 2 == 1, 21.5, np.nan),
+    )
+
+    pd.testing.assert_frame_equal(from_arrays.get_dataframe(), from_readings.get_dataframe())
+
+    with pytest.raises(ValueError):
+        from_arrays.append_arrays(
+            np.array(["2025-01-15T12:00:01"], dtype="datetime64[us]"),
+            np.zeros(2),
+            sensor_id="Q12345",
+            mode="freerun",
+        )
+
+
+def test_datastore_string_columns_are_categorical():
+    """Test sensor_id/mode are stored as codes but read back as the original strings."""
+    store = DataStore()
+    start = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+    store.append_readings(
+        [
+            Reading(
+                ts=start + timedelta(seconds=i),
+                sensor_id=f"Q{i % 2}",
+                mode="polled" if i == 2 else "freerun",
+                data={"value": float(i)},
+            )
+            for i in range(4)
+        ]
+    )
+
+    df = store.get_dataframe()
+    assert df["mode"].dtype == "category"
+    assert df["sensor_id"].tolist() == ["Q0", "Q1", "Q0", "Q1"]
+    assert df["mode"].tolist() == ["freerun", "freerun", "polled", "freerun"]
+    assert [row[1:3] for batch in store.iter_rows(chunk=3) for row in batch] == [
+        ("Q0", "freerun"),
+        ("Q1", "freerun"),
+        ("Q0", "polled"),
+        ("Q1", "freerun"),
+    ]
+    assert store.get_latest()["sensor_id"] == "Q1"
+
+
+def test_datastore_append_arrays_bulk_trim(make_arrays):
+    """Test bulk array ingest far past max_rows keeps the newest rows and stats."""
+    store = DataStore(max_rows=100_000)
+
+    for start in range(0, 250_000, 50_000):
+        store.append_arrays(
+            *make_arrays(50_000, period_s=0.1, start=start), sensor_id="Q12345", mode="freerun"
+        )
+
+    assert store.row_count() == 100_000
+    df = store.get_dataframe()
+    assert df["value"].iloc[0] == 150_000.0
+    assert df["value"].iloc[-1] == 249_999.0
+
+    stats = store.get_stats()
+    assert stats["duration_s"] == pytest.approx(99_999 * 0.1)
+    assert stats["est_sample_rate_hz"] == pytest.approx(10.0)
+
+
+def test_datastore_iter_rows_batches(sample_readings):
+    """Test iter_rows yields every row in order, in bounded batches."""
+    store = DataStore()
+
+    store.append_readings(sample_readings)
+
+    batches = list(store.iter_rows(chunk=2))
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert store.row_count() == 5
+
+    rows = [row for batch in batches for row in batch]
+    value_idx = list(SCHEMA.keys()).index("value")
+    assert [row[value_idx] for row in rows] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_datastore_iter_rows_snapshot_at_call(sample_readings):
+    """Test iter_rows snapshots at the call, before iteration starts."""
+    store = DataStore()
+    store.append_readings(sample_readings)
+
+    batches = store.iter_rows(chunk=10)
+    store.clear()
+
+    assert [len(b) for b in batches] == [5]
+
+
+def test_datastore_wait_for_rows(sample_readings):
+    """Test wait_for_rows() wakes on an append from another thread, or times out."""
+    store = DataStore()
+    assert store.wait_for_rows(0, timeout=0)
+    assert not store.wait_for_rows(1, timeout=0.05)
+
+    appender = Thread(target=store.append_readings, args=(sample_readings,))
+    appender.start()
+
+    assert store.wait_for_rows(5, timeout=2.0)
+    appender.join()
+
+
 def test_datastore_clear():
     """Test clear() resets DataFrame to empty."""
     store = DataStore()
@@ -404,8 +663,12 @@ def test_datastore_clear():
 # =============================================================================
 # DataRecorder Tests
 # =============================================================================
+# These run recorder/generator threads against wall-clock budgets, so under
+# pytest-xdist (-n auto --dist loadgroup) they share one worker instead of
+# competing for CPU with each other.
 
 
+@pytest.mark.xdist_group("stream")
 def test_recorder_basic_freerun_simulation():
     """Test recorder with fake controller simulating freerun mode at ~15 Hz."""
     controller = FakeController(mode="freerun")
@@ -434,6 +697,7 @@ def test_recorder_basic_freerun_simulation():
     assert (df["mode"] == "freerun").all()
 
 
+@pytest.mark.xdist_group("stream")
 def test_recorder_polled_mode_simulation():
     """Test recorder with fake controller simulating polled mode."""
     controller = FakeController(mode="polled")
@@ -459,6 +723,7 @@ def test_recorder_polled_mode_simulation():
     assert df["value"].tolist() == [100.0, 101.0, 102.0]
 
 
+@pytest.mark.xdist_group("stream")
 def test_recorder_filters_duplicate_timestamps():
     """Test that recorder filters already-seen readings by timestamp."""
     controller = FakeController(mode="freerun")
@@ -487,6 +752,7 @@ def test_recorder_filters_duplicate_timestamps():
     assert df["value"].tolist() == [100.0, 200.0]
 
 
+@pytest.mark.xdist_group("stream")
 def test_recorder_handles_empty_buffer():
     """Test that recorder doesn't crash when controller buffer is empty."""
     controller = FakeController(mode="freerun")
@@ -502,10 +768,11 @@ def test_recorder_handles_empty_buffer():
     assert store.get_dataframe().empty
 
 
+@pytest.mark.xdist_group("stream")
 def test_recorder_stop_with_flush_csv(tmp_path):
     """Test that stop(flush_format='csv') exports data."""
     controller = FakeController(mode="freerun")
-    store = DataStore()
+    store = DataStore(export_dir=str(tmp_path))
     recorder = DataRecorder(controller, store, poll_interval_s=0.1)
 
     # Add some readings
@@ -516,23 +783,36 @@ def test_recorder_stop_with_flush_csv(tmp_path):
     time.sleep(0.2)
 
     # Stop with flush
-    # Change to temp directory for flush
-    import os
-    old_cwd = os.getcwd()
-    os.chdir(tmp_path)
+    flush_path = recorder.stop(flush_format="csv")
+    assert flush_path is not None
+    assert Path(flush_path).exists()
+    assert Path(flush_path).parent == tmp_path
 
-    try:
-        flush_path = recorder.stop(flush_format="csv")
-        assert flush_path is not None
-        assert Path(flush_path).exists()
+    # Verify exported data
+    df_loaded = pd.read_csv(flush_path)
+    assert len(df_loaded) >= 2
 
-        # Verify exported data
-        df_loaded = pd.read_csv(flush_path)
-        assert len(df_loaded) >= 2
-    finally:
-        os.chdir(old_cwd)
 
+@pytest.mark.xdist_group("stream")
+def test_recorder_stop_flush_into_directory(tmp_path):
+    """Test that stop() writes a timestamped flush file into a given directory."""
+    controller = FakeController(mode="freerun")
+    store = DataStore()
+    recorder = DataRecorder(controller, store, poll_interval_s=0.1)
 
+    controller.add_reading(datetime.now(timezone.utc), value=100.0)
+
+    recorder.start()
+    time.sleep(0.2)
+
+    flush_path = recorder.stop(flush_format="parquet", flush_path=str(tmp_path))
+    assert flush_path is not None
+    assert Path(flush_path).parent == tmp_path
+    assert Path(flush_path).name.startswith("qsensor_data_")
+    assert Path(flush_path).suffix == ".parquet"
+
+
+@pytest.mark.xdist_group("stream")
 def test_recorder_with_optional_fields():
     """Test recorder handles readings with optional TempC and Vin fields."""
     controller = FakeController(mode="freerun", include_temp=True, include_vin=True)
@@ -552,6 +832,7 @@ def test_recorder_with_optional_fields():
     assert not pd.isna(df["Vin"].iloc[0])
 
 
+@pytest.mark.xdist_group("stream")
 def test_recorder_stop_order_warning():
     """Test that recorder can be stopped even if controller is stopped first.
 
@@ -580,6 +861,7 @@ def test_recorder_stop_order_warning():
 # =============================================================================
 
 
+@pytest.mark.xdist_group("stream")
 def test_full_workflow_freerun():
     """End-to-end test: freerun acquisition, recording, stats, export."""
     controller = FakeController(mode="freerun", include_temp=True)
@@ -610,10 +892,11 @@ def test_full_workflow_freerun():
     assert not df["TempC"].isna().any()
 
 
-def test_full_workflow_polled():
+@pytest.mark.xdist_group("stream")
+def test_full_workflow_polled(tmp_path):
     """End-to-end test: polled mode, manual queries, recording."""
     controller = FakeController(mode="polled")
-    store = DataStore()
+    store = DataStore(export_dir=str(tmp_path))
     recorder = DataRecorder(controller, store, poll_interval_s=0.1)
 
     recorder.start()
@@ -635,3 +918,28 @@ def test_full_workflow_polled():
     stats = store.get_stats()
     assert stats["row_count"] == 10
     assert 1.8 <= stats["est_sample_rate_hz"] <= 2.2  # ~2 Hz
+
+
+def test_datastore_get_recent_out_of_order_timestamps():
+    """Test get_recent() still filters correctly after an out-of-order append."""
+    store = DataStore()
+    now = datetime.now(timezone.utc)
+
+    def reading(age_s: float, value: float) -> Reading:
+        return Reading(
+            ts=now - timedelta(seconds=age_s),
+            sensor_id="Q12345",
+            mode="freerun",
+            data={"value": value},
+        )
+
+    store.append_readings([reading(90, 1.0), reading(10, 2.0)])
+    assert store.get_recent(seconds=60)["value"].tolist() == [2.0]
+
+    # Older than the last stored row: binary search no longer applies
+    store.append_readings([reading(120, 3.0), reading(5, 4.0)])
+    assert store.get_recent(seconds=60)["value"].tolist() == [2.0, 4.0]
+
+    store.clear()
+    store.append_readings([reading(90, 5.0), reading(1, 6.0)])
+    assert store.get_recent(seconds=60)["value"].tolist() == [6.0]
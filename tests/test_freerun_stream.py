@@ -23,8 +23,8 @@ def test_start_freerun_acquisition() -> None:
 
     assert controller.state == ConnectionState.ACQ_FREERUN
 
-    # Give time for thread to start and get some readings
-    time.sleep(2.0)
+    # Wait for the reader thread to buffer some readings
+    assert controller.wait_for_samples(1, timeout=3.0)
 
     # Check that readings are being buffered
     readings = controller.read_buffer_snapshot()
@@ -51,13 +51,15 @@ def test_freerun_reading_rate() -> None:
     controller.set_mode("freerun")
     controller.start_acquisition()
 
-    # Wait for approximately 3 samples
-    time.sleep(3.5)
+    # Lines that fell due during start-up arrive in one burst; skip past them
+    assert controller.wait_for_samples(1, timeout=3.0)
+    start_count = len(controller.read_buffer_snapshot())
+    start = time.monotonic()
 
-    readings = controller.read_buffer_snapshot()
-
-    # Should have received 3-4 readings (allow some timing variance)
-    assert 2 <= len(readings) <= 5, f"Expected 2-5 readings, got {len(readings)}"
+    # Three more readings at ~1 Hz take 2-3 s (allow some timing variance)
+    assert controller.wait_for_samples(start_count + 3, timeout=4.0)
+    elapsed = time.monotonic() - start
+    assert 1.8 <= elapsed <= 3.5, f"Expected 3 readings in ~2-3 s, took {elapsed:.2f} s"
 
     controller.disconnect()
 
@@ -74,7 +76,7 @@ def test_freerun_with_temp_and_vin() -> None:
     controller.set_mode("freerun")
     controller.start_acquisition()
 
-    time.sleep(2.0)
+    assert controller.wait_for_samples(1, timeout=3.0)
 
     readings = controller.read_buffer_snapshot()
     assert len(readings) > 0
@@ -102,8 +104,10 @@ def test_freerun_buffer_overflow() -> None:
     controller.set_mode("freerun")
     controller.start_acquisition()
 
-    # Wait for buffer to overflow
-    time.sleep(2.0)
+    # Fill the buffer, then wait for further readings so it overflows
+    assert controller.wait_for_samples(5, timeout=3.0)
+    for _ in range(3):
+        assert controller.wait_for_reading(timeout=1.0)
 
     readings = controller.read_buffer_snapshot()
 
@@ -122,7 +126,7 @@ def test_clear_buffer() -> None:
     controller.set_mode("freerun")
     controller.start_acquisition()
 
-    time.sleep(1.5)
+    assert controller.wait_for_samples(1, timeout=3.0)
 
     readings = controller.read_buffer_snapshot()
     assert len(readings) > 0
@@ -144,7 +148,7 @@ def test_freerun_sensor_id_in_readings() -> None:
     controller.set_mode("freerun")
     controller.start_acquisition()
 
-    time.sleep(1.5)
+    assert controller.wait_for_samples(1, timeout=3.0)
 
     readings = controller.read_buffer_snapshot()
     assert len(readings) > 0
@@ -153,3 +157,42 @@ def test_freerun_sensor_id_in_readings() -> None:
         assert reading.sensor_id == "SENSOR999"
 
     controller.disconnect()
+
+
+def test_wait_for_reading_wakes_on_new_data() -> None:
+    """Test that wait_for_reading returns once the reader thread buffers a reading."""
+    fake_serial = FakeSerial()
+    fake_serial.averaging = 12
+    fake_serial.adc_rate_hz = 125  # ~10 Hz
+
+    controller = SensorController()
+    controller.connect(serial_port=fake_serial)
+
+    # Nothing is acquiring yet, so the wait times out
+    assert controller.wait_for_reading(timeout=0.1) is False
+
+    controller.start_acquisition()
+
+    assert controller.wait_for_reading(timeout=2.0) is True
+    assert controller.buffer_len() > 0
+
+    controller.disconnect()
+
+
+def test_freerun_noise_filter_skips_banner_not_data() -> None:
+    """Test the reader's banner/menu filter never matches data lines."""
+    from q_sensor_lib import protocol
+
+    is_noise = protocol.RE_FREERUN_NOISE.search
+
+    for line in [
+        "Biospherical Instruments Inc: Digital Engine Vers 4.003",
+        "ADC sample rate 125, gain 1",
+        "Averaging 125 readings",
+        "A to set number of samples averaged before update: 125",
+        "Rebooting program",
+    ]:
+        assert is_noise(line), line
+
+    for line in ["100.123456", "$LITE99.5, 21.50, 12.345", "-0.000123, 20.00"]:
+        assert not is_noise(line), line
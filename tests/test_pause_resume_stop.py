@@ -20,7 +20,7 @@ def test_pause_from_freerun() -> None:
 
     assert controller.state == ConnectionState.ACQ_FREERUN
 
-    time.sleep(1.0)
+    assert controller.wait_for_samples(1, timeout=3.0)
 
     # Pause
     controller.pause()
@@ -46,7 +46,7 @@ def test_resume_from_paused() -> None:
     controller.set_mode("freerun")
     controller.start_acquisition()
 
-    time.sleep(1.0)
+    assert controller.wait_for_samples(1, timeout=3.0)
 
     # Pause
     controller.pause()
@@ -60,7 +60,7 @@ def test_resume_from_paused() -> None:
     assert controller.state == ConnectionState.ACQ_FREERUN
 
     # Should get new readings
-    time.sleep(1.5)
+    assert controller.wait_for_samples(1, timeout=3.0)
     readings = controller.read_buffer_snapshot()
 
     assert len(readings) > 0, "Should receive readings after resume"
@@ -79,7 +79,7 @@ def test_stop_from_freerun() -> None:
 
     assert controller.state == ConnectionState.ACQ_FREERUN
 
-    time.sleep(1.0)
+    assert controller.wait_for_samples(1, timeout=3.0)
 
     # Stop
     controller.stop()
@@ -104,7 +104,7 @@ def test_stop_from_polled() -> None:
 
     assert controller.state == ConnectionState.ACQ_POLLED
 
-    time.sleep(1.5)
+    assert controller.wait_for_samples(1, timeout=3.0)
 
     # Stop
     controller.stop()
@@ -126,7 +126,7 @@ def test_pause_resume_preserves_mode() -> None:
 
     assert controller.state == ConnectionState.ACQ_POLLED
 
-    time.sleep(1.0)
+    assert controller.wait_for_samples(1, timeout=3.0)
 
     # Pause
     controller.pause()
@@ -137,7 +137,7 @@ def test_pause_resume_preserves_mode() -> None:
     assert controller.state == ConnectionState.ACQ_POLLED
 
     # Should get polled readings
-    time.sleep(1.5)
+    assert controller.wait_for_samples(controller.buffer_len() + 1, timeout=3.0)
     readings = controller.read_buffer_snapshot()
     assert len(readings) > 0
     assert readings[0].mode == "polled"
@@ -184,7 +184,7 @@ def test_stop_from_paused() -> None:
     controller.set_mode("freerun")
     controller.start_acquisition()
 
-    time.sleep(1.0)
+    assert controller.wait_for_samples(1, timeout=3.0)
 
     controller.pause()
     assert controller.state == ConnectionState.PAUSED
@@ -0,0 +1,161 @@
+"""Unit tests for the polled reader loop against a stub transport.
+
+No device or FakeSerial is involved and the timing tests run on a virtual
+clock, so unlike tests/test_polled_sequence.py nothing here is slow.
+"""
+
+import threading
+import time
+from typing import Optional
+
+import pytest
+
+from q_sensor_lib import controller as controller_module
+from q_sensor_lib.controller import SensorController
+
+
+class VirtualClock:
+    """Virtual time for the polled loop, so nothing really sleeps.
+
+    Stands in for the controller module's time.monotonic_ns and for the
+    loop's stop event: wait(timeout) just advances the clock, and the event
+    reads as set once stop_after_s has passed. Tick times are then exact
+    however loaded the machine is.
+    """
+
+    def __init__(self, stop_after_s: float) -> None:
+        self.now_ns = 0
+        self.stop_ns = round(stop_after_s * 1e9)
+
+    def monotonic_ns(self) -> int:
+        return self.now_ns
+
+    def sleep(self, seconds: float) -> None:
+        self.now_ns += round(seconds * 1e9)
+
+    def is_set(self) -> bool:
+        return self.now_ns >= self.stop_ns
+
+    def set(self) -> None:
+        self.stop_ns = self.now_ns
+
+    def wait(self, timeout: float) -> bool:
+        self.sleep(timeout)
+        return self.is_set()
+
+
+class StubTransport:
+    """Answers every polled query with a TAG A reading after reply_delay_s.
+
+    The first reply can take first_reply_delay_s instead. Records when each
+    query went out (monotonic ns, on the clock if one is given); queried is
+    set on the first one.
+    """
+
+    def __init__(
+        self,
+        reply_delay_s: float,
+        clock: Optional[VirtualClock] = None,
+        first_reply_delay_s: Optional[float] = None,
+    ) -> None:
+        self.reply_delay_s = reply_delay_s
+        self.first_reply_delay_s = first_reply_delay_s
+        self.sent_at: list[int] = []
+        self.queried = threading.Event()
+        self._now_ns = clock.monotonic_ns if clock else time.monotonic_ns
+        self._sleep = clock.sleep if clock else time.sleep
+
+    def write_bytes(self, data: bytes) -> None:
+        self.sent_at.append(self._now_ns())
+        self.queried.set()
+
+    def readline(self) -> str:
+        delay = self.reply_delay_s
+        if self.first_reply_delay_s is not None and len(self.sent_at) == 1:
+            delay = self.first_reply_delay_s
+        if delay:
+            self._sleep(delay)
+        return "A,123.456"
+
+
+@pytest.fixture
+def polled_loop(monkeypatch):
+    """Start SensorController._polled_reader_loop on a thread against a StubTransport.
+
+    Call it as polled_loop(reply_delay_s, poll_hz, clock=None,
+    first_reply_delay_s=None); it returns the controller, transport and
+    thread. With a VirtualClock the loop runs on virtual time and stops by
+    itself. Loops still running at teardown are stopped and joined there, so
+    a failed assert cannot leave one polling.
+    """
+    runs = []
+
+    def start(
+        reply_delay_s: float,
+        poll_hz: float,
+        clock: Optional[VirtualClock] = None,
+        first_reply_delay_s: Optional[float] = None,
+    ):
+        controller = SensorController()
+        transport = StubTransport(reply_delay_s, clock, first_reply_delay_s)
+        controller._transport = transport
+        if clock is not None:
+            monkeypatch.setattr(controller_module, "time", clock)
+            controller._stop_event = clock
+        thread = threading.Thread(
+            target=controller._polled_reader_loop, args=("A", poll_hz), daemon=True
+        )
+        runs.append((controller, thread))
+        thread.start()
+        return controller, transport, thread
+
+    yield start
+
+    for controller, thread in runs:
+        controller._stop_event.set()
+        thread.join(timeout=2.0)
+
+
+def stop_loop(controller: SensorController, thread: threading.Thread) -> None:
+    """Stop a loop started by polled_loop and wait for its thread to exit."""
+    controller._stop_event.set()
+    thread.join(timeout=2.0)
+
+
+def test_polled_loop_holds_rate_with_slow_responses(polled_loop) -> None:
+    """Test queries stay on the poll_hz grid even when each response takes a while."""
+    clock = VirtualClock(stop_after_s=1.0)
+    controller, transport, thread = polled_loop(0.02, 20.0, clock)
+    thread.join(timeout=2.0)
+    assert not thread.is_alive()
+
+    # Absolute ticks: the 20 ms response time must not stretch the 50 ms period
+    assert transport.sent_at == [k * 50_000_000 for k in range(20)]
+    assert controller.buffer_len() == 20
+
+
+def test_polled_loop_skips_overrun_ticks(polled_loop) -> None:
+    """Test a reply slower than the period drops ticks instead of bursting queries."""
+    # The first reply takes 180 ms, overrunning the 50, 100 and 150 ms ticks
+    clock = VirtualClock(stop_after_s=1.0)
+    controller, transport, thread = polled_loop(0.0, 20.0, clock, first_reply_delay_s=0.18)
+    thread.join(timeout=2.0)
+    assert not thread.is_alive()
+
+    # The late cycle polls once as soon as the reply is in, then the loop is
+    # back on the grid; the overrun ticks are never replayed back to back
+    ms = 1_000_000
+    assert transport.sent_at == [0, 180 * ms] + [t * ms for t in range(200, 1000, 50)]
+
+
+def test_polled_loop_stops_promptly_between_ticks(polled_loop) -> None:
+    """Test stopping at a slow poll rate interrupts the wait instead of sleeping it out."""
+    # 0.2 Hz: after the first query the loop waits about 5 s for the next tick
+    controller, transport, thread = polled_loop(0.0, 0.2)
+    assert transport.queried.wait(timeout=1.0)
+
+    start = time.monotonic()
+    stop_loop(controller, thread)
+
+    assert not thread.is_alive()
+    assert time.monotonic() - start < 0.5
@@ -8,12 +8,58 @@ from fakes.fake_serial import FakeSerial
 from q_sensor_lib.controller import SensorController
 from q_sensor_lib.models import ConnectionState
 
+# Every test here waits out seconds of real polling
+pytestmark = pytest.mark.slow
 
-def test_start_polled_acquisition() -> None:
-    """Test starting acquisition in polled mode."""
-    fake_serial = FakeSerial()
+
+@pytest.fixture(scope="module")
+def fake_serial():
+    """One FakeSerial shared by the module; connecting is the slow part of each test."""
+    return FakeSerial()
+
+
+@pytest.fixture(scope="module")
+def controller(fake_serial):
+    """SensorController connected once to the shared FakeSerial."""
     controller = SensorController()
     controller.connect(serial_port=fake_serial)
+    yield controller
+    controller.disconnect()
+
+
+@pytest.fixture
+def polled(request, controller, fake_serial):
+    """The shared controller in CONFIG_MENU with an empty buffer.
+
+    Acquisition left running is stopped, and averaging and ADC rate are put
+    back to what they were before the test. A failed test may leave the
+    device mid-exchange; the device is then reset and the controller
+    reconnected, so one failure cannot cascade into the following tests.
+    """
+    if controller.state != ConnectionState.CONFIG_MENU:
+        controller.stop()
+
+    # Copied out: get_config() returns the live config, which set_* updates
+    config = controller.get_config()
+    averaging, adc_rate_hz = config.averaging, config.adc_rate_hz
+    controller.clear_buffer()
+    yield controller
+
+    if request.node.rep_call.failed:
+        controller.disconnect()
+        fake_serial.reset()
+        controller.connect(serial_port=fake_serial)
+        return
+
+    if controller.state != ConnectionState.CONFIG_MENU:
+        controller.stop()
+    # Unchanged fields are skipped, so this only talks to the device if needed
+    controller.set_config(averaging=averaging, adc_rate_hz=adc_rate_hz)
+
+
+def test_start_polled_acquisition(polled) -> None:
+    """Test starting acquisition in polled mode."""
+    controller = polled
 
     # Set to polled mode with TAG
     controller.set_mode("polled", tag="A")
@@ -23,12 +69,9 @@ def test_start_polled_acquisition() -> None:
 
     assert controller.state == ConnectionState.ACQ_POLLED
 
-    # Give time for initialization and some polls
-    time.sleep(2.5)
-
     # Check that readings are being buffered
+    assert controller.wait_for_samples(1, timeout=3.0), "Should have received polled readings"
     readings = controller.read_buffer_snapshot()
-    assert len(readings) > 0, "Should have received polled readings"
 
     # Verify reading structure
     first_reading = readings[0]
@@ -36,14 +79,10 @@ def test_start_polled_acquisition() -> None:
     assert "value" in first_reading.data
     assert isinstance(first_reading.data["value"], float)
 
-    controller.disconnect()
-
 
-def test_polled_reading_rate() -> None:
+def test_polled_reading_rate(polled) -> None:
     """Test that polled readings arrive at expected rate."""
-    fake_serial = FakeSerial()
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = polled
 
     controller.set_mode("polled", tag="B")
 
@@ -58,32 +97,21 @@ def test_polled_reading_rate() -> None:
     # Should have received 8-12 readings (allow variance)
     assert 6 <= len(readings) <= 14, f"Expected 6-14 readings at 5Hz, got {len(readings)}"
 
-    controller.disconnect()
-
 
-def test_polled_with_different_tag() -> None:
+@pytest.mark.parametrize("tag", ["C", "D", "Z"])
+def test_polled_with_different_tag(polled, tag) -> None:
     """Test polled mode with different TAG characters."""
-    for tag in ["C", "D", "Z"]:
-        fake_serial = FakeSerial()
-        controller = SensorController()
-        controller.connect(serial_port=fake_serial)
+    controller = polled
 
-        controller.set_mode("polled", tag=tag)
-        controller.start_acquisition(poll_hz=2.0)
-
-        time.sleep(2.0)
+    controller.set_mode("polled", tag=tag)
+    controller.start_acquisition(poll_hz=2.0)
 
-        readings = controller.read_buffer_snapshot()
-        assert len(readings) > 0, f"No readings received for tag {tag}"
+    assert controller.wait_for_samples(1, timeout=3.0), f"No readings received for tag {tag}"
 
-        controller.disconnect()
 
-
-def test_polled_slow_rate() -> None:
+def test_polled_slow_rate(polled) -> None:
     """Test polled mode at slow rate (1 Hz)."""
-    fake_serial = FakeSerial()
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = polled
 
     controller.set_mode("polled", tag="A")
 
@@ -98,60 +126,41 @@ def test_polled_slow_rate() -> None:
     # Should have 3-4 readings
     assert 2 <= len(readings) <= 5, f"Expected 2-5 readings at 1Hz, got {len(readings)}"
 
-    controller.disconnect()
 
-
-def test_polled_initialization_sequence() -> None:
+def test_polled_initialization_sequence(polled, fake_serial) -> None:
     """Test that polled mode sends *<TAG>Q000! before polling."""
-    fake_serial = FakeSerial()
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = polled
 
     controller.set_mode("polled", tag="A")
 
     # Start acquisition
     controller.start_acquisition(poll_hz=2.0)
 
-    # FakeSerial should have received init command
-    # (internal state check - fake_serial._sampling_started should be True)
-    time.sleep(2.0)
-
-    assert fake_serial._sampling_started, "Polled initialization command not received"
-
     # Should have readings
-    readings = controller.read_buffer_snapshot()
-    assert len(readings) > 0
+    assert controller.wait_for_samples(1, timeout=3.0)
 
-    controller.disconnect()
+    # FakeSerial should have received init command (starting acquisition resets
+    # the device, so _sampling_started is only True if this start re-sent it)
+    assert fake_serial._sampling_started, "Polled initialization command not received"
 
 
-def test_polled_mode_tag_validation_in_responses() -> None:
+def test_polled_mode_tag_validation_in_responses(polled) -> None:
     """Test that polled responses are validated against TAG."""
-    fake_serial = FakeSerial()
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = polled
 
     controller.set_mode("polled", tag="A")
     controller.start_acquisition(poll_hz=2.0)
 
-    time.sleep(2.0)
-
-    readings = controller.read_buffer_snapshot()
-
     # All readings should have been validated (no exceptions raised)
-    assert len(readings) > 0
+    assert controller.wait_for_samples(2, timeout=3.0)
+    assert all(r.mode == "polled" for r in controller.read_buffer_snapshot())
 
-    controller.disconnect()
 
-
-def test_polled_with_high_poll_rate() -> None:
+def test_polled_with_high_poll_rate(polled) -> None:
     """Test polled mode at higher rate (10 Hz)."""
-    fake_serial = FakeSerial()
-    fake_serial.averaging = 10  # Fast averaging
-    fake_serial.adc_rate_hz = 125
-
-    controller = SensorController()
-    controller.connect(serial_port=fake_serial)
+    controller = polled
+    controller.set_averaging(10)  # Fast averaging
+    controller.set_adc_rate(125)
 
     controller.set_mode("polled", tag="A")
 
@@ -164,5 +173,3 @@ def test_polled_with_high_poll_rate() -> None:
 
     # Should have received 15-25 readings (allow variance)
     assert 10 <= len(readings) <= 30, f"Expected 10-30 readings at 10Hz, got {len(readings)}"
-
-    controller.disconnect()
@@ -0,0 +1,125 @@
+"""Tests for the reading ring buffer and controller buffer accessors."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from q_sensor_lib.controller import SensorController
+from q_sensor_lib.models import Reading
+from q_sensor_lib.ring_buffer import RingBuffer
+
+
+def make_reading(i: int) -> Reading:
+    """Build a freerun reading with value i and a ts i seconds past a fixed epoch."""
+    return Reading(
+        ts=datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc) + timedelta(seconds=i),
+        sensor_id="Q12345",
+        mode="freerun",
+        data={"value": float(i)},
+    )
+
+
+def test_ring_buffer_get_by_index() -> None:
+    """Test positional access, including negative indexes and eviction."""
+    buffer = RingBuffer(maxlen=3)
+    for i in range(5):
+        buffer.append(make_reading(i))
+
+    assert len(buffer) == 3
+    assert buffer.get(0).data["value"] == 2.0
+    assert buffer.get(-1).data["value"] == 4.0
+
+    with pytest.raises(IndexError):
+        buffer.get(3)
+
+
+def test_controller_buffer_len_and_get_reading() -> None:
+    """Test buffer_len/get_reading expose the buffer without a snapshot copy."""
+    controller = SensorController(buffer_size=10)
+
+    assert controller.buffer_len() == 0
+    with pytest.raises(IndexError):
+        controller.get_reading(-1)
+
+    for i in range(3):
+        controller._buffer.append(make_reading(i))
+
+    assert controller.buffer_len() == 3
+    assert controller.get_reading(-1).data["value"] == 2.0
+    assert controller.get_reading(0).data["value"] == 0.0
+
+
+def test_ring_buffer_latest() -> None:
+    """Test latest() returns the newest reading, or None when empty."""
+    buffer = RingBuffer(maxlen=2)
+    assert buffer.latest() is None
+
+    for i in range(3):
+        buffer.append(make_reading(i))
+
+    assert buffer.latest().data["value"] == 2.0
+
+    controller = SensorController(buffer_size=2)
+    assert controller.read_latest() is None
+    controller._buffer.append(make_reading(7))
+    assert controller.read_latest().data["value"] == 7.0
+
+
+def test_ring_buffer_snapshot_array_matches_readings() -> None:
+    """Test the columnar snapshot stays ordered across wraparound and clear."""
+    import numpy as np
+
+    from q_sensor_lib.ring_buffer import MODE_CODES
+
+    buffer = RingBuffer(maxlen=4)
+    assert len(buffer.snapshot_array()) == 0
+
+    for i in range(6):
+        buffer.append(make_reading(i))
+
+    arr = buffer.snapshot_array()
+    assert arr["value"].tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert (arr["mode"] == MODE_CODES["freerun"]).all()
+    assert arr["ts"][0] == np.datetime64("2025-01-15T12:00:02", "us")
+    assert (arr["ts"][-1] - arr["ts"][0]) / np.timedelta64(1, "s") == 3.0
+
+    buffer.clear()
+    buffer.append(make_reading(9))
+    assert buffer.snapshot_array()["value"].tolist() == [9.0]
+
+
+def test_ring_buffer_wait_for_len() -> None:
+    """Test wait_for_len wakes on appends from another thread and honours timeout."""
+    import threading
+
+    buffer = RingBuffer(maxlen=3)
+    assert buffer.wait_for_len(1, timeout=0.05) is False
+
+    threading.Timer(0.05, lambda: [buffer.append(make_reading(i)) for i in range(2)]).start()
+    assert buffer.wait_for_len(2, timeout=2.0) is True
+
+    controller = SensorController(buffer_size=3)
+    controller._buffer.append(make_reading(0))
+    assert controller.wait_for_samples(1, timeout=0.0) is True
+    assert controller.wait_for_samples(2, timeout=0.05) is False
+
+
+def test_ring_buffer_snapshot_array_window() -> None:
+    """Test max_n and since select the newest readings, across wraparound."""
+    buffer = RingBuffer(maxlen=4)
+    for i in range(6):
+        buffer.append(make_reading(i))
+
+    assert buffer.snapshot_array(max_n=3)["value"].tolist() == [3.0, 4.0, 5.0]
+    assert buffer.snapshot_array(max_n=10)["value"].tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert len(buffer.snapshot_array(max_n=0)) == 0
+
+    since = make_reading(3).ts
+    assert buffer.snapshot_array(since=since)["value"].tolist() == [4.0, 5.0]
+    assert buffer.snapshot_array(since=since.replace(tzinfo=None))["value"].tolist() == [4.0, 5.0]
+    assert buffer.snapshot_array(max_n=1, since=since)["value"].tolist() == [5.0]
+
+    controller = SensorController(buffer_size=4)
+    controller._buffer.append(make_reading(0))
+    controller._buffer.append(make_reading(1))
+    assert controller.read_buffer_array(since=make_reading(0).ts)["value"].tolist() == [1.0]
@@ -0,0 +1,273 @@
+"""Tests for the serial Transport wrapper."""
+
+import select
+from typing import List, Optional
+
+import pytest
+
+from q_sensor_lib.errors import SerialIOError
+from q_sensor_lib.transport import Transport
+
+
+class RecordingPort:
+    """Minimal SerialLike stand-in that records every write call."""
+
+    def __init__(self, lines: Optional[List[bytes]] = None) -> None:
+        self.writes: List[bytes] = []
+        self.lines = list(lines or [])
+        self.is_open = True
+
+    def write(self, data: bytes) -> int:
+        self.writes.append(data)
+        return len(data)
+
+    def read(self, size: int = 1) -> bytes:
+        return b""
+
+    def readline(self) -> bytes:
+        return self.lines.pop(0) if self.lines else b""
+
+    def flush(self) -> None:
+        pass
+
+    def reset_input_buffer(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+def test_write_cmds_single_write() -> None:
+    """Test that write_cmds sends the whole CR-terminated sequence in one write."""
+    port = RecordingPort()
+    transport = Transport(port)
+
+    transport.write_cmds(["A", "125"])
+
+    assert port.writes == [b"A\r125\r"]
+
+
+def test_write_cmds_empty_is_noop() -> None:
+    """Test that an empty command list writes nothing."""
+    port = RecordingPort()
+    transport = Transport(port)
+
+    transport.write_cmds([])
+
+    assert port.writes == []
+
+
+def test_readline_strips_terminators() -> None:
+    """Test that readline trims CRLF, bare CR, or bare LF terminators."""
+    port = RecordingPort([b"100.123456\r\n", b"prompt: \r", b"no cr\n", b"partial"])
+    transport = Transport(port)
+
+    assert transport.readline() == "100.123456"
+    assert transport.readline() == "prompt: "
+    assert transport.readline() == "no cr"
+    assert transport.readline() == "partial"
+    assert transport.readline() is None
+
+
+def test_closed_transport_rejects_io() -> None:
+    """Test that I/O after close() raises SerialIOError without touching the port."""
+    port = RecordingPort()
+    transport = Transport(port)
+
+    transport.close()
+
+    assert not transport.is_open
+    assert not port.is_open
+    with pytest.raises(SerialIOError):
+        transport.write_cmd("A")
+    with pytest.raises(SerialIOError):
+        transport.readline()
+    assert port.writes == []
+
+
+class StreamPort(RecordingPort):
+    """SerialLike stand-in with in_waiting/read() over a byte stream."""
+
+    def __init__(self, data: bytes = b"") -> None:
+        super().__init__()
+        self.rx = bytearray(data)
+        self.read_calls = 0
+        self.timeout = 0.05
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.rx)
+
+    def read(self, size: int = 1) -> bytes:
+        self.read_calls += 1
+        data = bytes(self.rx[:size])
+        del self.rx[:size]
+        return data
+
+
+def test_readline_drains_available_bytes_once() -> None:
+    """Test that lines arriving together are served from one port read."""
+    port = StreamPort(b"Unit ID Q12345\r\nADC sample rate 125, gain 1\r\n")
+    transport = Transport(port)
+
+    assert transport.readline() == "Unit ID Q12345"
+    assert transport.readline() == "ADC sample rate 125, gain 1"
+    assert port.read_calls == 1
+
+
+def test_read_lines_returns_partial_batch_on_timeout() -> None:
+    """Test read_lines stops at its shared deadline with the lines it has."""
+    port = StreamPort(b"100.1\r\n100.2\r\n")
+    transport = Transport(port)
+
+    assert transport.read_lines(2) == ["100.1", "100.2"]
+    assert transport.read_lines(3, timeout_per_line=0.01) == []
+
+
+def test_flush_input_discards_buffered_lines() -> None:
+    """Test that flush_input drops lines already pulled into the rx buffer."""
+    port = StreamPort(b"banner line 1\r\nbanner line 2\r\n")
+    transport = Transport(port)
+
+    assert transport.readline() == "banner line 1"
+    transport.flush_input()
+
+    assert transport.readline(timeout=0.01) is None
+
+
+def test_open_sizes_driver_buffers_on_win32(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that open() requests larger driver queues on Windows."""
+    import serial
+
+    from q_sensor_lib import transport as transport_module
+
+    calls = []
+
+    class FakeSerialClass(RecordingPort):
+        def __init__(self, **kwargs: object) -> None:
+            super().__init__()
+
+        def set_buffer_size(self, rx_size: int, tx_size: int) -> None:
+            calls.append((rx_size, tx_size))
+
+        def reset_input_buffer(self) -> None:
+            calls.append("reset_input_buffer")
+
+    monkeypatch.setattr(serial, "Serial", FakeSerialClass)
+    monkeypatch.setattr(transport_module.sys, "platform", "win32")
+
+    Transport.open("COM3")
+
+    assert calls == [
+        (transport_module.WIN32_RX_BUFFER_SIZE, transport_module.WIN32_TX_BUFFER_SIZE),
+        "reset_input_buffer",
+    ]
+
+
+def test_open_flushes_stale_input_on_posix(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that open() drops stale tty input with tcflush on POSIX."""
+    import termios
+
+    import serial
+
+    from q_sensor_lib import transport as transport_module
+
+    flushed = []
+
+    class FakeSerialClass(RecordingPort):
+        fd = 42
+
+        def __init__(self, **kwargs: object) -> None:
+            super().__init__()
+
+    monkeypatch.setattr(serial, "Serial", FakeSerialClass)
+    monkeypatch.setattr(transport_module.sys, "platform", "linux")
+    monkeypatch.setattr(termios, "tcflush", lambda fd, queue: flushed.append((fd, queue)))
+
+    Transport.open("/dev/ttyUSB0")
+
+    assert flushed == [(42, termios.TCIFLUSH)]
+
+
+def test_write_cmd_reuses_encoded_command() -> None:
+    """Test that write_cmd sends identical bytes from its encoded-command cache."""
+    port = RecordingPort()
+    transport = Transport(port)
+
+    transport.write_cmd("X")
+    transport.write_cmd("X")
+
+    assert port.writes == [b"X\r", b"X\r"]
+    assert port.writes[0] is port.writes[1]
+
+
+class PipePort(RecordingPort):
+    """SerialLike stand-in backed by an OS pipe, so it has a pollable fd."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        import os
+
+        self._os = os
+        self.rfd, self.wfd = os.pipe()
+        self.timeout = 0.5
+
+    def fileno(self) -> int:
+        return self.rfd
+
+    @property
+    def in_waiting(self) -> int:
+        import fcntl
+        import struct
+        import termios
+
+        raw = fcntl.ioctl(self.rfd, termios.FIONREAD, b"\0\0\0\0")
+        return struct.unpack("I", raw)[0]
+
+    def read(self, size: int = 1) -> bytes:
+        if not self.in_waiting:
+            return b""
+        return self._os.read(self.rfd, size)
+
+    def feed(self, data: bytes) -> None:
+        self._os.write(self.wfd, data)
+
+    def close(self) -> None:
+        super().close()
+        self._os.close(self.rfd)
+        self._os.close(self.wfd)
+
+
+@pytest.mark.skipif(not hasattr(select, "poll"), reason="select.poll not available")
+def test_readline_polls_fd_until_deadline() -> None:
+    """Test fd-backed ports are waited on with poll() and honour the timeout."""
+    import threading
+    import time
+
+    port = PipePort()
+    transport = Transport(port)
+    assert port.timeout == 0  # Switched to non-blocking reads
+
+    start = time.monotonic()
+    assert transport.readline(timeout=0.1) is None
+    assert time.monotonic() - start < 0.3
+
+    threading.Timer(0.05, port.feed, args=(b"100.5\r\n",)).start()
+    assert transport.readline(timeout=1.0) == "100.5"
+
+    transport.close()
+
+
+def test_readline_reassembles_line_split_across_reads() -> None:
+    """Test that a line trickling in over several reads is returned whole."""
+
+    class TricklePort(StreamPort):
+        def read(self, size: int = 1) -> bytes:
+            return super().read(min(size, 3))
+
+    port = TricklePort(b"100.123456, 21.50\r\nnext\r\n")
+    transport = Transport(port)
+
+    assert transport.readline() == "100.123456, 21.50"
+    assert transport.readline() == "next"
+    assert port.read_calls == 9
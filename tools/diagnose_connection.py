@@ -1,5 +1,6 @@
 """Diagnose what happens during connection attempt."""
 
+import select
 import serial
 import time
 import sys
@@ -25,12 +26,20 @@ def diagnose_connection(port="/dev/ttyUSB0"):
     print("\n=== Waiting 1 second to see initial output ===")
     time.sleep(1.0)
 
-    received = []
-    while True:
-        line = ser.readline()
-        if not line:
+    # Take what has queued in one-read chunks until the line stays quiet for
+    # 100 ms, so a banner still arriving at 9600 baud is not mistaken below
+    # for the reply to ESC (capped, as a streaming sensor never goes quiet)
+    banner = bytearray(ser.read(ser.in_waiting))
+    drain_deadline = time.monotonic() + 5.0
+    while time.monotonic() < drain_deadline:
+        ready, _, _ = select.select([ser.fileno()], [], [], 0.1)
+        if not ready:
             break
-        decoded = line.decode('ascii', errors='replace').rstrip('\r\n')
+        banner += ser.read(ser.in_waiting)
+
+    received = []
+    for line in banner.splitlines():
+        decoded = line.decode('ascii', errors='replace')
         print(f"RX: {decoded!r}")
         received.append(decoded)
 
@@ -43,25 +52,37 @@ def diagnose_connection(port="/dev/ttyUSB0"):
     ser.flush()
     print(f"Sent {sent} bytes (ESC), flushed")
 
-    # Wait for response
+    # Wait for response: block on the port fd until bytes arrive and drain
+    # whatever is there in one read, so the prompt is seen as soon as it lands
+    # (the prompt has no CRLF, which would cost readline() a full timeout)
     print("\n=== Waiting 5 seconds for menu prompt ===")
-    start = time.time()
+    deadline = time.monotonic() + 5.0
     found_menu = False
+    buf = bytearray()
 
-    while time.time() - start < 5.0:
-        line = ser.readline()
-        if not line:
-            continue
+    while (remaining := deadline - time.monotonic()) > 0:
+        ready, _, _ = select.select([ser.fileno()], [], [], remaining)
+        if not ready:
+            break
+        buf += ser.read(ser.in_waiting or 1)
+        found_menu = b"Select the letter" in buf
 
-        decoded = line.decode('ascii', errors='replace').rstrip('\r\n')
-        print(f"RX: {decoded!r}")
+        # Show complete lines as they arrive; keep any partial line buffered
+        *lines, rest = buf.split(b"\n")
+        for line in lines:
+            decoded = line.decode('ascii', errors='replace').rstrip('\r')
+            print(f"RX: {decoded!r}")
+        buf = bytearray(rest)
 
-        if "Select the letter" in decoded:
-            found_menu = True
-            print("\n*** FOUND MENU PROMPT ***")
+        if found_menu:
             break
 
-    if not found_menu:
+    if buf:
+        print(f"RX: {buf.decode('ascii', errors='replace')!r}")
+
+    if found_menu:
+        print("\n*** FOUND MENU PROMPT ***")
+    else:
         print("\n*** MENU PROMPT NOT FOUND - ESC DID NOT WORK ***")
         print("\nPossible reasons:")
         print("1. Sensor is streaming and doesn't respond to ESC")